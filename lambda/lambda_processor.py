@@ -1,3 +1,4 @@
+import http.client
 import os
 import re
 import shutil
@@ -6,8 +7,10 @@ import tempfile
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import boto3
+import numpy as np
 
 # Environment variables provided in the Lambda configuration
 DEST_BUCKET = os.environ.get("DEST_BUCKET", "")
@@ -15,19 +18,134 @@ DEST_PREFIX = os.environ.get("DEST_PREFIX", "").rstrip("/")  # remove trailing '
 NETCDF_DOWNLOAD_RETRIES = max(1, int(os.environ.get("NETCDF_DOWNLOAD_RETRIES", "4")))
 NETCDF_DOWNLOAD_TIMEOUT = int(os.environ.get("NETCDF_DOWNLOAD_TIMEOUT", "60"))
 NETCDF_DOWNLOAD_BACKOFF = float(os.environ.get("NETCDF_DOWNLOAD_BACKOFF", "5"))
+NETCDF_DOWNLOAD_PARTS = max(1, int(os.environ.get("NETCDF_DOWNLOAD_PARTS", "4")))
+NETCDF_DOWNLOAD_BUFFER = 8 * 1024 * 1024
+# Read the NetCDF straight from its URL with HTTP range requests instead of copying it to /tmp
+NETCDF_REMOTE_OPEN = os.environ.get("NETCDF_REMOTE_OPEN", "0").lower() in ("1", "true", "yes")
+S3_UPLOAD_WORKERS = max(1, int(os.environ.get("S3_UPLOAD_WORKERS", "16")))
+PARQUET_ROW_GROUP_SIZE = max(1, int(os.environ.get("PARQUET_ROW_GROUP_SIZE", "65536")))
+PARQUET_ZSTD_LEVEL = int(os.environ.get("PARQUET_ZSTD_LEVEL", "3"))
+
+# Float fields compress best with BYTE_STREAM_SPLIT; repetitive columns keep dictionary
+# encoding (pyarrow prefers the dictionary when both are enabled for a column).
+PARQUET_FLOAT_COLUMNS = ["topo", "wind_dir", "wind_speed"]
+PARQUET_DICTIONARY_COLUMNS = ["time", "x", "y", "source_model", "date", "hour", "timestamp"]
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": PARQUET_ZSTD_LEVEL,
+    "use_dictionary": PARQUET_DICTIONARY_COLUMNS,
+    "use_byte_stream_split": PARQUET_FLOAT_COLUMNS,
+    "row_group_size": PARQUET_ROW_GROUP_SIZE,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+
+# Daily MeteoGalicia files end in _YYYYMMDD_0000.nc4
+_NETCDF_DATE_RE = re.compile(r"_(\d{8})_0000\.nc4$")
 
 s3_client = boto3.client('s3')
 
+# Created on first use so cold starts do not pay for the Arrow S3 client
+_s3_filesystem = None
+
+
+def _get_s3_filesystem():
+    """Return the shared pyarrow S3 filesystem used to stream outputs to the bucket."""
+    global _s3_filesystem
+    if _s3_filesystem is None:
+        from pyarrow import fs as pafs
+
+        region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
+        _s3_filesystem = pafs.S3FileSystem(region=region) if region else pafs.S3FileSystem()
+    return _s3_filesystem
+
+
+def _ranged_content_length(url, timeout_seconds):
+    """Return the remote size when the server accepts byte ranges, otherwise None."""
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+            if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return None
+            return int(response.headers.get("Content-Length") or 0) or None
+    except (urllib.error.URLError, socket.timeout, ValueError):
+        return None
+
+
+class _RangeNotHonoured(IOError):
+    """The server answered a Range request with the full body instead of HTTP 206."""
+
+
+def _download_stream(url, destination, timeout_seconds):
+    with urllib.request.urlopen(url, timeout=timeout_seconds) as response, open(destination, "wb") as out_file:
+        shutil.copyfileobj(response, out_file, length=NETCDF_DOWNLOAD_BUFFER)
+
+
+def _download_ranges(url, destination, size, parts, timeout_seconds):
+    """Fetch size bytes of url as parallel Range requests written in place with pwrite."""
+    part_size = -(-size // parts)
+    with open(destination, "wb") as out_file:
+        out_file.truncate(size)
+    fd = os.open(destination, os.O_WRONLY)
+
+    def fetch(start):
+        end = min(start + part_size, size) - 1
+        request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+        offset = start
+        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+            if response.status != 206:
+                raise _RangeNotHonoured(f"Server ignored range request for {url} (HTTP {response.status})")
+            while True:
+                chunk = response.read(NETCDF_DOWNLOAD_BUFFER)
+                if not chunk:
+                    break
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+        if offset != end + 1:
+            raise IOError(f"Incomplete range {start}-{end} for {url}: got {offset - start} bytes")
+
+    try:
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            list(executor.map(fetch, range(0, size, part_size)))
+    finally:
+        os.close(fd)
+
+
+def _open_remote_netcdf(url):
+    """Return a seekable file object over url, or None when fsspec/h5netcdf are unavailable."""
+    try:
+        import fsspec
+        import h5netcdf  # noqa: F401  (xarray engine used on the returned handle)
+    except ImportError:
+        print("WARNING: NETCDF_REMOTE_OPEN requires fsspec and h5netcdf; downloading instead")
+        return None
+    return fsspec.open(url, mode="rb", block_size=NETCDF_DOWNLOAD_BUFFER).open()
+
 
 def _download_with_retry(url, destination, timeout_seconds, retries, backoff_seconds):
-    """Download URL to destination with retry/backoff to survive transient network hiccups."""
+    """Download URL to destination with retry/backoff to survive transient network hiccups.
+
+    Large files on servers advertising byte-range support are fetched as
+    NETCDF_DOWNLOAD_PARTS concurrent ranges; otherwise the body is streamed with an
+    8 MiB copy buffer.
+    """
     last_error = None
     for attempt in range(1, retries + 1):
         try:
-            with urllib.request.urlopen(url, timeout=timeout_seconds) as response, open(destination, "wb") as out_file:
-                shutil.copyfileobj(response, out_file)
+            size = None
+            if NETCDF_DOWNLOAD_PARTS > 1:
+                size = _ranged_content_length(url, timeout_seconds)
+            if size and size > NETCDF_DOWNLOAD_BUFFER:
+                try:
+                    _download_ranges(url, destination, size, NETCDF_DOWNLOAD_PARTS, timeout_seconds)
+                except _RangeNotHonoured as exc:
+                    print(f"WARNING: {exc}; falling back to a single-stream download")
+                    _download_stream(url, destination, timeout_seconds)
+            else:
+                _download_stream(url, destination, timeout_seconds)
             return
-        except (urllib.error.URLError, socket.timeout) as exc:
+        # OSError covers URLError, socket.timeout and truncated ranges
+        except (OSError, http.client.IncompleteRead) as exc:
             last_error = exc
             print(f"WARNING: Download attempt {attempt}/{retries} failed for {url}: {exc}")
         except Exception as exc:
@@ -41,21 +159,87 @@ def _download_with_retry(url, destination, timeout_seconds, retries, backoff_sec
     if last_error:
         raise last_error
 
+
+def _write_to_s3(key, label, write):
+    """Open an S3 output stream for key, let write() fill it and log the outcome."""
+    try:
+        with _get_s3_filesystem().open_output_stream(f"{DEST_BUCKET}/{key}") as sink:
+            write(sink)
+    except Exception as e:
+        print(f"ERROR: Failed to upload {label}. Detail: {e}")
+        raise
+    print(f"{label} uploaded to s3://{DEST_BUCKET}/{key}")
+    return key
+
+
+def _write_parquet_to_s3(table, key, label):
+    """Stream a Parquet encoding of table directly into the destination bucket."""
+    import pyarrow.parquet as pq
+
+    return _write_to_s3(key, label, lambda sink: pq.write_table(table, sink, **PARQUET_WRITE_OPTIONS))
+
+
+def _write_bytes_to_s3(body, key, label):
+    """Store a small in-memory payload with a single PutObject (no multipart stream)."""
+    try:
+        s3_client.put_object(Bucket=DEST_BUCKET, Key=key, Body=body)
+    except Exception as e:
+        print(f"ERROR: Failed to upload {label}. Detail: {e}")
+        raise
+    print(f"{label} uploaded to s3://{DEST_BUCKET}/{key}")
+    return key
+
+
+def _normalize_meta_value(value):
+    """Recursively convert numpy/scalar values to plain Python types for JSON serialization."""
+    if isinstance(value, dict):
+        return {str(k): _normalize_meta_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_normalize_meta_value(item) for item in value]
+    if isinstance(value, (np.generic,)):
+        return value.item()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", errors="ignore")
+    if isinstance(value, np.ndarray):
+        return [_normalize_meta_value(item) for item in value.tolist()]
+    return value
+
+
+def _collect_variable_attributes(dataset):
+    return {
+        name: {k: _normalize_meta_value(v) for k, v in var.attrs.items()}
+        for name, var in dataset.variables.items()
+    }
+
+
+def _points_wkb_array(lon, lat):
+    """Encode lon/lat pairs as little-endian 2D WKB points in an Arrow binary array."""
+    import pyarrow as pa
+
+    num_points = lon.shape[0]
+    # Fixed 21-byte layout: byte order (1 = little endian), geometry type (1 = Point), x, y
+    wkb = np.empty((num_points, 21), dtype=np.uint8)
+    wkb[:, :5] = np.frombuffer(b"\x01\x01\x00\x00\x00", dtype=np.uint8)
+    coords = wkb[:, 5:].view("<f8")
+    coords[:, 0] = lon
+    coords[:, 1] = lat
+    offsets = np.arange(0, 21 * (num_points + 1), 21, dtype=np.int32)
+    return pa.Array.from_buffers(
+        pa.binary(), num_points, [None, pa.py_buffer(offsets), pa.py_buffer(wkb)]
+    )
+
 def _lambda_handler(event, context):
     """
     Lambda handler that processes a NetCDF file:
       - Downloads the file from the provided URL (or constructs it from a date).
       - Converts the variables lat, lon, dir (wind direction) and mod (wind speed) to a tabular DataFrame.
-      - Writes the DataFrame to a Parquet file.
-      - Uploads the Parquet to the destination S3 bucket (partitioned by year, month, day).
+      - Streams one Parquet file per hour straight to the destination S3 bucket
+        (partitioned by year, month, day, hour) without staging it in /tmp.
     """
     # Import heavy dependencies inside handler for faster cold starts
     import xarray as xr
     import pandas as pd
-    import numpy as np
     import pyarrow as pa
-    import pyarrow.parquet as pq
-    import geopandas as gpd
     import json
 
     # Get NetCDF URL from the event
@@ -65,7 +249,7 @@ def _lambda_handler(event, context):
     if "url" in event:
         url = event["url"]
         # Try to extract the YYYYMMDD date from the filename in the URL (assuming known pattern)
-        m = re.search(r"_([0-9]{8})_0000.nc4$", url)
+        m = _NETCDF_DATE_RE.search(url)
         if m:
             date_str = m.group(1)  # Ejemplo: "20250101"
         else:
@@ -87,26 +271,39 @@ def _lambda_handler(event, context):
     else:
         raise ValueError("Event does not contain 'url' or 'date' to process.")
 
-    # Define temporary path to download NetCDF
-    local_netcdf = os.path.join(tempfile.gettempdir(), "data.nc")
-    try:
-        _download_with_retry(
-            url,
-            local_netcdf,
-            timeout_seconds=NETCDF_DOWNLOAD_TIMEOUT,
-            retries=NETCDF_DOWNLOAD_RETRIES,
-            backoff_seconds=NETCDF_DOWNLOAD_BACKOFF,
-        )
-    except Exception as e:
-        print(f"ERROR: Failed to download file {url} after retries. Detail: {e}")
-        raise
+    # Optionally open the NetCDF in place: only the variables read below are fetched
+    ds = None
+    if NETCDF_REMOTE_OPEN:
+        try:
+            remote_file = _open_remote_netcdf(url)
+            if remote_file is not None:
+                ds = xr.open_dataset(remote_file, engine="h5netcdf", cache=False)
+        except Exception as e:
+            print(f"WARNING: Could not open {url} remotely, downloading instead. Detail: {e}")
+            ds = None
 
-    # Open the NetCDF file with xarray
-    try:
-        ds = xr.open_dataset(local_netcdf)
-    except Exception as e:
-        print(f"ERROR: No se pudo abrir el archivo NetCDF descargado. Detalle: {e}")
-        raise
+    if ds is None:
+        # Define temporary path to download NetCDF
+        local_netcdf = os.path.join(tempfile.gettempdir(), "data.nc")
+        try:
+            _download_with_retry(
+                url,
+                local_netcdf,
+                timeout_seconds=NETCDF_DOWNLOAD_TIMEOUT,
+                retries=NETCDF_DOWNLOAD_RETRIES,
+                backoff_seconds=NETCDF_DOWNLOAD_BACKOFF,
+            )
+        except Exception as e:
+            print(f"ERROR: Failed to download file {url} after retries. Detail: {e}")
+            raise
+
+        # Open the NetCDF file with xarray; cache=False keeps the decoded arrays out of the
+        # dataset so only the float32 copies built below stay resident
+        try:
+            ds = xr.open_dataset(local_netcdf, cache=False)
+        except Exception as e:
+            print(f"ERROR: No se pudo abrir el archivo NetCDF descargado. Detalle: {e}")
+            raise
 
     # Verify that required variables exist in the dataset, including grid coordinates x and y
     for var in ["lat", "lon", "dir", "mod", "x", "y", "topo"]:
@@ -115,12 +312,20 @@ def _lambda_handler(event, context):
             raise KeyError(f"Variable {var} missing in data")
 
     # Extract projection (CRS) information from CF grid mapping variable, if available
+    # CF data variables name their projection variable in `grid_mapping`; scan only as a fallback
     proj_var = None
-    for var_name in ds.variables:
-        if 'grid_mapping_name' in ds[var_name].attrs:
-            proj_var = var_name
-            proj_attrs = ds[var_name].attrs
+    for data_var in ("dir", "mod"):
+        gm_name = ds[data_var].attrs.get("grid_mapping") or ds[data_var].encoding.get("grid_mapping")
+        if gm_name and gm_name in ds.variables and 'grid_mapping_name' in ds[gm_name].attrs:
+            proj_var = gm_name
+            proj_attrs = ds[gm_name].attrs
             break
+    if proj_var is None:
+        for var_name in ds.variables:
+            if 'grid_mapping_name' in ds[var_name].attrs:
+                proj_var = var_name
+                proj_attrs = ds[var_name].attrs
+                break
     if proj_var:
         proj_parts = [f"+proj={proj_attrs.get('grid_mapping_name')}" ]
         sp = proj_attrs.get('standard_parallel')
@@ -164,19 +369,37 @@ def _lambda_handler(event, context):
     x_arr = ds["x"].values   # shape (nx,)
     y_arr = ds["y"].values   # shape (ny,)
     times = ds["time"].values  # shape (time,)
+    # Partition and label strings for every hour, formatted in one vectorized pass
+    times_idx = pd.DatetimeIndex(times)
+    date_strs = times_idx.strftime("%Y-%m-%d")
+    hour_strs = times_idx.strftime("%H")
+    timestamp_strs = times_idx.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     ny, nx = lat.shape
     num_points = ny * nx
     num_times = times.shape[0]
 
-    lat_flat = lat.flatten()
-    lon_flat = lon.flatten()
+    lat_flat = lat.ravel()
+    lon_flat = lon.ravel()
+
+    # Materialize each time-varying field once as (time, point) float32 rows; per-hour slices
+    # are views. When the decoded variable is already float32 in time-major order no copy is made.
+    def _load_time_rows(name):
+        values = ds[name].transpose("time", ...).values
+        return np.ascontiguousarray(values, dtype=np.float32).reshape(num_times, num_points)
+
+    dir_all = _load_time_rows("dir")
+    spd_all = _load_time_rows("mod")
+    topo_all = _load_time_rows("topo")
 
     # Generate 1D arrays for grid coordinates corresponding to each point
-    # x_arr is 1D along x dimension, y_arr is 1D along y dimension
-    x_grid, y_grid = np.meshgrid(x_arr, y_arr)
-    x_flat = x_grid.flatten()
-    y_flat = y_grid.flatten()
+    # x_arr is 1D along x dimension, y_arr is 1D along y dimension; row-major order
+    # repeats the whole x axis for every y (same layout as meshgrid(x, y).flatten())
+    x_flat = np.tile(x_arr, ny)
+    y_flat = np.repeat(y_arr, nx)
+
+    # Point geometries in WGS84 are identical for every hour: encode them once
+    geometry_wkb = _points_wkb_array(lon_flat, lat_flat)
 
     # Capture optional region definition from event (no spatial filtering applied)
     regions = event.get('regions')
@@ -187,24 +410,41 @@ def _lambda_handler(event, context):
     # Default region name to filename if not provided
     if not region_name:
         region_name = os.path.splitext(os.path.basename(url))[0]
-    # Define Parquet schema including x and y grid coordinates
+    # Define Parquet schema including x and y grid coordinates; lat/lon are carried
+    # by the WKB geometry column
     schema = pa.schema([
         pa.field("time", pa.timestamp("ns")),
-        pa.field("lat", pa.float64()),
-        pa.field("lon", pa.float64()),
         pa.field("x", pa.float64()),
         pa.field("y", pa.float64()),
         pa.field("topo", pa.float32()),
         pa.field("wind_dir", pa.float32()),
         pa.field("wind_speed", pa.float32()),
-        pa.field("source_model", pa.string())
+        pa.field("source_model", pa.string()),
+        pa.field("geometry", pa.binary()),
+        pa.field("date", pa.string()),
+        pa.field("hour", pa.string()),
+        pa.field("timestamp", pa.string())
     ])
+    # Also recorded in the footer key/value metadata so catalog builders can read it
+    # without touching column statistics or data pages
+    schema = schema.with_metadata({"source_model": str(source_model)})
+
+    # Columns that do not change between hours are converted to Arrow once
+    x_array = pa.array(x_flat, type=pa.float64())
+    y_array = pa.array(y_flat, type=pa.float64())
+
+    # Constant string columns stay plain strings on disk (R arrow reads dictionary
+    # columns as factors); the Parquet writer dictionary-encodes them anyway
+    def _constant_string_column(value):
+        return pa.repeat(pa.scalar(value, type=pa.string()), num_points)
+
+    source_model_array = _constant_string_column(source_model)
 
     # Stream each time slice to separate Parquet files partitioned by hour
     # and upload each to S3 under year/month/day/hour folder.
     # Derive date_str from first timestamp if not provided
     if date_str is None:
-        date_str = pd.to_datetime(times[0]).strftime("%Y%m%d")
+        date_str = times_idx[0].strftime("%Y%m%d")
 
     year = date_str[0:4]
     month = date_str[4:6]
@@ -217,29 +457,23 @@ def _lambda_handler(event, context):
     else:
         metadata_prefix = "metadata/"
 
-    uploaded = []
-
-    def _normalize_meta_value(value):
-        """Recursively convert numpy/scalar values to plain Python types for JSON serialization."""
-        import numpy as np
-
-        if isinstance(value, dict):
-            return {str(k): _normalize_meta_value(v) for k, v in value.items()}
-        if isinstance(value, (list, tuple, set)):
-            return [_normalize_meta_value(item) for item in value]
-        if isinstance(value, (np.generic,)):
-            return value.item()
-        if isinstance(value, (bytes, bytearray)):
-            return value.decode("utf-8", errors="ignore")
-        if isinstance(value, np.ndarray):
-            return [_normalize_meta_value(item) for item in value.tolist()]
-        return value
-
-    def _collect_variable_attributes(dataset):
-        return {
-            name: {k: _normalize_meta_value(v) for k, v in var.attrs.items()}
-            for name, var in dataset.variables.items()
-        }
+    # Writes are I/O-bound: each hour is encoded and streamed to S3 by a worker (pyarrow
+    # releases the GIL) while the main thread builds the next one. Futures are keyed by S3
+    # key so a repeated hour still overwrites the earlier one.
+    executor = ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS)
+    pending_writes = {}
+
+    def _submit_write(key, writer, payload, label):
+        previous = pending_writes.get(key)
+        if previous is not None:
+            previous.result()
+        # Bound the hourly tables held in memory and surface failed writes early
+        in_flight = [future for future in pending_writes.values() if not future.done()]
+        if len(in_flight) >= 2 * S3_UPLOAD_WORKERS:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        pending_writes[key] = executor.submit(writer, payload, key, label)
 
     sidecar_common = {
         "netcdf_attributes": {
@@ -276,86 +510,64 @@ def _lambda_handler(event, context):
         if polygon:
             region_entry["polygon"] = polygon
         regions_payload = [region_entry]
-    for idx in range(num_times):
-        dir_slice = ds["dir"].isel(time=idx).values.flatten().astype(np.float32)
-        spd_slice = ds["mod"].isel(time=idx).values.flatten().astype(np.float32)
-        # Extract topography slice (elevation) for this time index
-        topo_slice = ds["topo"].isel(time=idx).values.flatten().astype(np.float32)
-        time_val = pd.to_datetime(times[idx])
-        hour_str = time_val.strftime("%H")
-        time_slice = np.full(
-            num_points,
-            times[idx], dtype="datetime64[ns]"
-        )
 
-        # Build GeoDataFrame slice and write GeoParquet with embedded CRS and NetCDF metadata
-        df_slice = pd.DataFrame({
-            'time': time_slice,
-            'lat': lat_flat,
-            'lon': lon_flat,
-            'x': x_flat,
-            'y': y_flat,
-            'topo': topo_slice,
-            'wind_dir': dir_slice,
-            'wind_speed': spd_slice,
-            'source_model': source_model
-        })
-        # Create GeoDataFrame in geographic WGS84; embed model grid mapping in metadata
-        gdf = gpd.GeoDataFrame(
-            df_slice,
-            geometry=gpd.points_from_xy(df_slice.lon, df_slice.lat),
-            crs="EPSG:4326"
-        )
-        # Serialize geometry to WKB and attach NetCDF metadata (including original projection)
-        gdf['geom_wkb'] = gdf.geometry.apply(lambda geom: geom.wkb)
-        # Build table: drop lat/lon/geometry and rename WKB column to 'geometry'
-        df_for_table = gdf.drop(columns=['lat', 'lon', 'geometry']).rename(columns={'geom_wkb': 'geometry'})
-        df_for_table["date"] = time_val.strftime("%Y-%m-%d")
-        df_for_table["hour"] = hour_str
-        df_for_table["timestamp"] = time_val.strftime("%Y-%m-%dT%H:%M:%SZ")
-        table = pa.Table.from_pandas(df_for_table, preserve_index=False)
-        hour_parquet = os.path.join(tempfile.gettempdir(), f"data_{hour_str}.parquet")
-        pq.write_table(table, hour_parquet, compression="snappy")
+    # Lineage metadata is the same for every hour: build and encode the sidecar once.
+    # Sidecars are machine-read, so skip pretty-printing.
+    sidecar_payload = {
+        "crs": proj_string,
+        "nc_proj_string": proj_string,
+        **sidecar_common
+    }
+    if regions_payload:
+        sidecar_payload["regions"] = regions_payload
+    if region_name:
+        sidecar_payload["region_name"] = region_name
+    if test_points_payload:
+        sidecar_payload["test_points"] = test_points_payload
+    if url:
+        sidecar_payload["source_url"] = url
+    if source_model:
+        sidecar_payload["source_model"] = source_model
+    sidecar_body = json.dumps(sidecar_payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
+    for idx in range(num_times):
+        dir_slice = dir_all[idx]
+        spd_slice = spd_all[idx]
+        # Topography slice (elevation) for this time index
+        topo_slice = topo_all[idx]
+        hour_str = hour_strs[idx]
+        # Fill the constant time column inside Arrow rather than through a NumPy temporary
+        time_column = pa.repeat(pa.scalar(times[idx], type=pa.timestamp("ns")), num_points)
+
+        # Assemble the hourly table straight from the NumPy buffers (no pandas round trip)
+        table = pa.Table.from_arrays([
+            time_column,
+            x_array,
+            y_array,
+            pa.array(topo_slice),
+            pa.array(dir_slice),
+            pa.array(spd_slice),
+            source_model_array,
+            geometry_wkb,
+            _constant_string_column(date_strs[idx]),
+            _constant_string_column(hour_str),
+            _constant_string_column(timestamp_strs[idx]),
+        ], schema=schema)
         key = f"{prefix}year={year}/month={month}/day={day}/hour={hour_str}/data.parquet"
-        try:
-            s3_client.upload_file(hour_parquet, DEST_BUCKET, key)
-            print(f"GeoParquet for hour {hour_str} uploaded to s3://{DEST_BUCKET}/{key}")
-            uploaded.append(key)
-        except Exception as e:
-            print(f"ERROR: Failed to upload GeoParquet for hour {hour_str}. Detail: {e}")
-            raise
-
-        # Persist lineage metadata to sidecar JSON outside the data tree
-        sidecar_payload = {
-            "crs": proj_string,
-            "nc_proj_string": proj_string,
-            **sidecar_common
-        }
-        if regions_payload:
-            sidecar_payload["regions"] = regions_payload
-        if region_name:
-            sidecar_payload["region_name"] = region_name
-        if test_points_payload:
-            sidecar_payload["test_points"] = test_points_payload
-        if url:
-            sidecar_payload["source_url"] = url
-        if source_model:
-            sidecar_payload["source_model"] = source_model
-        sidecar_local = os.path.join(tempfile.gettempdir(), f"metadata_{hour_str}.json")
-        with open(sidecar_local, "w", encoding="utf-8") as sidecar_file:
-            json.dump(sidecar_payload, sidecar_file, ensure_ascii=False, indent=2)
+        _submit_write(key, _write_parquet_to_s3, table, f"GeoParquet for hour {hour_str}")
 
+        # Persist lineage metadata to sidecar JSON outside the data tree. The body is the same
+        # for every hour, but readers (R ingestion, STAC builder, region updater) resolve the
+        # sidecar next to each hour partition, so one copy per hour is kept.
         sidecar_key = (
             f"{metadata_prefix}year={year}/month={month}/day={day}/hour={hour_str}/metadata.json"
         )
-        try:
-            s3_client.upload_file(sidecar_local, DEST_BUCKET, sidecar_key)
-            print(f"Metadata sidecar uploaded to s3://{DEST_BUCKET}/{sidecar_key}")
-            uploaded.append(sidecar_key)
-        except Exception as e:
-            print(f"ERROR: Failed to upload metadata sidecar for hour {hour_str}. Detail: {e}")
-            raise
+        _submit_write(sidecar_key, _write_bytes_to_s3, sidecar_body, f"Metadata sidecar for hour {hour_str}")
+
+    try:
+        uploaded = [future.result() for future in pending_writes.values()]
+    finally:
+        executor.shutdown(wait=True)
 
     # Return summary of uploaded files
     return {
@@ -44,17 +44,27 @@ def load_sidecar(parquet_path: str):
     return sidecar_path, {}
 
 
-def load_regions_from_table(table):
-    df = table.to_pandas()
-    regions_values = df.get('regions')
-    if regions_values is not None:
-        for value in regions_values:
+def first_regions_value(parquet_file):
+    """Return the first non-empty legacy `regions` string without decoding other columns."""
+    if 'regions' not in parquet_file.schema_arrow.names:
+        return None
+    column = parquet_file.read(columns=['regions']).column('regions')
+    for chunk in column.chunks:
+        for scalar in chunk:
+            value = scalar.as_py()
             if isinstance(value, str) and value.strip():
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    break
-    metadata = dict(table.schema.metadata or {})
+                return value
+    return None
+
+
+def load_regions_from_parquet(parquet_file):
+    value = first_regions_value(parquet_file)
+    if value is not None:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    metadata = dict(parquet_file.schema_arrow.metadata or {})
     raw = metadata.get(b'regions')
     if raw:
         try:
@@ -63,18 +73,46 @@ def load_regions_from_table(table):
             sys.exit(f"Failed to parse existing regions JSON metadata: {exc}")
     return []
 
+def existing_compression(parquet_file):
+    """Return the codec of the first column chunk, in the spelling accepted by write_table."""
+    metadata = parquet_file.metadata
+    if metadata.num_row_groups == 0 or metadata.num_columns == 0:
+        return 'snappy'
+    codec = metadata.row_group(0).column(0).compression
+    return {'UNCOMPRESSED': 'none', 'LZ4_RAW': 'lz4'}.get(codec, codec.lower())
+
+
+def constant_string_column(value, template):
+    """Plain string column repeating `value`, chunked like `template`.
+
+    The column stays pa.string(): R arrow reads dictionary columns as factors, which
+    the regions readers do not accept, and Parquet dictionary-encodes it anyway.
+    Per-chunk repeats keep each chunk's string offsets within int32.
+    """
+    return pa.chunked_array(
+        [pa.repeat(pa.scalar(value, type=pa.string()), len(chunk)) for chunk in template.chunks],
+        type=pa.string(),
+    )
+
+
 def main():
     if len(sys.argv) != 4:
         sys.exit(__doc__)
 
     op, arg, path = sys.argv[1], sys.argv[2], sys.argv[3]
-    table = pq.read_table(path)
-    metadata = dict(table.schema.metadata or {})
     sidecar_path, sidecar_data = load_sidecar(path)
+    # Only the footer (and, for legacy files, the regions column) is needed to read regions
+    parquet_file = pq.ParquetFile(path)
+    try:
+        metadata = dict(parquet_file.schema_arrow.metadata or {})
+        has_regions_column = 'regions' in parquet_file.schema_arrow.names
+        compression = existing_compression(parquet_file)
 
-    regions = sidecar_data.get('regions')
-    if regions is None:
-        regions = load_regions_from_table(table)
+        regions = sidecar_data.get('regions')
+        if regions is None:
+            regions = load_regions_from_parquet(parquet_file)
+    finally:
+        parquet_file.close()
 
     if op == '--add':
         try:
@@ -92,14 +130,17 @@ def main():
     else:
         sys.exit(__doc__)
 
-    if 'regions' in table.column_names:
+    if has_regions_column:
+        # Swap only the constant regions column; the other columns stay as Arrow buffers.
+        # The sidecar written below remains the authoritative copy for readers.
         regions_json = json.dumps(regions)
-        df = table.to_pandas()
-        df['regions'] = regions_json
-        new_table = pa.Table.from_pandas(df, preserve_index=False)
+        table = pq.read_table(path)
+        idx = table.schema.get_field_index('regions')
+        regions_col = constant_string_column(regions_json, table.column(idx))
+        new_table = table.set_column(idx, pa.field('regions', pa.string()), regions_col)
         new_meta = {k: v for k, v in metadata.items() if k != b'regions'}
         new_table = new_table.replace_schema_metadata(new_meta)
-        pq.write_table(new_table, path)
+        pq.write_table(new_table, path, compression=compression)
 
     if sidecar_data.get('regions') != regions:
         sidecar_data['regions'] = regions
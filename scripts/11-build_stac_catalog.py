@@ -27,6 +27,7 @@ Requirements:
 * pyarrow >= 10.0.0 (for parquet & filesystem access)
 * pystac >= 1.8.0
 * shapely is NOT required; geometries are emitted as bbox polygons.
+* orjson is optional; when installed it is used for GeoParquet metadata and STAC JSON I/O.
 
 The script exits with a descriptive error if dependencies are missing.
 """
@@ -34,18 +35,24 @@ The script exits with a descriptive error if dependencies are missing.
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import math
 import os
 import shutil
 import sys
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Set, Union
 import re
 
 try:
     import pyarrow as pa  # noqa: F401  (used indirectly via parquet/fs)
+    import pyarrow.compute as pc
     import pyarrow.parquet as pq
     import pyarrow.fs as pafs
 except ImportError as exc:  # pragma: no cover - dependency guard
@@ -56,7 +63,7 @@ except ImportError as exc:  # pragma: no cover - dependency guard
 
 try:
     import pystac
-    from pystac import Asset, Catalog, CatalogType, Collection, Extent, Item, Link
+    from pystac import Asset, Catalog, Collection, Extent, Item, Link
     from pystac.extensions.table import Column, TableExtension
 except ImportError as exc:  # pragma: no cover - dependency guard
     sys.exit(
@@ -64,13 +71,40 @@ except ImportError as exc:  # pragma: no cover - dependency guard
         "running this script."
     )
 
+try:  # optional: faster JSON parsing/serialisation when available
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+DEFAULT_IO_CONCURRENCY = 16
+# Remote object stores are latency bound, so more footer reads are kept in flight
+DEFAULT_REMOTE_IO_CONCURRENCY = 64
+
+# Output layout: collection.json, items/<kind>/catalog.json, items/<kind>/<id>/<id>.json
+COLLECTION_ROOT_LINK = {"rel": "root", "href": "./collection.json", "type": "application/json"}
+ITEM_HIERARCHY_LINKS = (
+    {"rel": "root", "href": "../../../collection.json", "type": "application/json"},
+    {"rel": "parent", "href": "../catalog.json", "type": "application/json"},
+)
+SUBCATALOG_HIERARCHY_LINKS = (
+    {"rel": "root", "href": "../../collection.json", "type": "application/json"},
+    {"rel": "parent", "href": "../../collection.json", "type": "application/json"},
+)
+LOCAL_FS = pafs.LocalFileSystem()
+
 
 # ---------------------------------------------------------------------------
 # Utility helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=16)
 def resolve_fs_and_base(prefix: str) -> Tuple[pafs.FileSystem, str]:
-    """Return a filesystem and base path for the provided prefix."""
+    """Return a filesystem and base path for the provided prefix.
+
+    Results are cached per prefix so repeated lookups skip URI parsing and, for S3,
+    region and credential resolution.
+    """
     try:
         fs, base = pafs.FileSystem.from_uri(prefix)
         return fs, base
@@ -79,38 +113,86 @@ def resolve_fs_and_base(prefix: str) -> Tuple[pafs.FileSystem, str]:
         return fs, os.fspath(Path(prefix).resolve())
 
 
-def build_href(prefix: Optional[str], relative: PurePosixPath) -> Optional[str]:
-    """Compose an href from a prefix and a relative path."""
-    if prefix is None:
-        return None
-    if "://" in prefix:
-        return prefix.rstrip("/") + "/" + str(relative)
-    return str(Path(prefix) / Path(str(relative)))
+@dataclass
+class HrefBuilder:
+    """Compose asset hrefs under one prefix, parsed once per run.
+
+    Remote prefixes yield absolute URIs; local prefixes yield paths relative to the
+    item directory; without a prefix the relative path itself is used.
+    """
+
+    prefix: Optional[str]
+    is_remote: bool = field(init=False)
+    remote_base: str = field(init=False)
+    local_base: Optional[Path] = field(init=False)
+    # items root -> href prefix from any item directory under it to local_base
+    item_dir_prefixes: Dict[Path, str] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.is_remote = bool(self.prefix) and "://" in self.prefix
+        self.remote_base = self.prefix.rstrip("/") if self.is_remote else ""
+        self.local_base = Path(self.prefix) if self.prefix and not self.is_remote else None
+
+    def build(self, relative: PurePosixPath, items_root: Path) -> str:
+        """Href of `relative` as seen from an item directory directly under items_root."""
+        if self.is_remote:
+            return f"{self.remote_base}/{relative}"
+        if self.local_base is not None:
+            prefix = self.item_dir_prefixes.get(items_root)
+            if prefix is None:
+                prefix = item_dir_prefix(self.local_base, items_root)
+                self.item_dir_prefixes[items_root] = prefix
+            if prefix:
+                return prefix + str(relative)
+            return str(self.local_base / relative)
+        return str(relative)
+
+
+def item_dir_prefix(target_dir: Path, items_root: Path) -> str:
+    """Relative href prefix from any ``<items_root>/<item-id>/`` directory to target_dir.
+
+    Computed once per directory pair so item hrefs are plain concatenations instead of
+    an os.path.relpath per asset; empty when no relative path exists (other drive).
+    """
+    try:
+        rel = os.path.relpath(target_dir, items_root).replace(os.sep, "/")
+    except ValueError:
+        return ""
+    return "../" if rel == "." else f"../{rel}/"
 
 
 def relative_from_base(full_path: str, base: str) -> PurePosixPath:
     """Compute the relative path of full_path with respect to base."""
+    prefix = base.rstrip("/") + "/"
+    if full_path.startswith(prefix):
+        return PurePosixPath(full_path[len(prefix):])
     full_norm = PurePosixPath(full_path)
-    base_norm = PurePosixPath(base)
     try:
-        return full_norm.relative_to(base_norm)
+        return full_norm.relative_to(PurePosixPath(base))
     except ValueError:
-        prefix = base.rstrip("/") + "/"
-        if full_path.startswith(prefix):
-            return PurePosixPath(full_path[len(prefix):])
-    return PurePosixPath(full_norm.name)
+        return PurePosixPath(full_norm.name)
 
 
 def copy_from_fs(fs: pafs.FileSystem, source: str, destination: Path) -> bool:
-    """Copy a file from a filesystem into the local catalog assets directory."""
+    """Copy a file from a filesystem into the local catalog assets directory.
+
+    Called concurrently from the item-building thread pool, which provides the
+    cross-file parallelism. Local sources go through shutil.copyfile, which copies
+    in-kernel (sendfile) on Linux; remote sources are streamed by Arrow in C++.
+    """
     try:
         ensure_dir(str(destination.parent))
-        with fs.open_input_file(source) as src, open(destination, "wb") as dst:
-            while True:
-                chunk = src.read(8 * 1024 * 1024)
-                if not chunk:
-                    break
-                dst.write(chunk)
+        if isinstance(fs, pafs.LocalFileSystem):
+            shutil.copyfile(source, destination)
+            return True
+        pafs.copy_files(
+            source,
+            os.fspath(destination.resolve()),
+            source_filesystem=fs,
+            destination_filesystem=LOCAL_FS,
+            chunk_size=16 * 1024 * 1024,
+            use_threads=False,
+        )
         return True
     except FileNotFoundError:
         return False
@@ -147,8 +229,13 @@ def merge_bbox(a: Optional[Tuple[float, float, float, float]],
     return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
 
 
+@functools.lru_cache(maxsize=256)
 def bbox_to_polygon(bbox: Tuple[float, float, float, float]) -> Dict[str, Sequence[Sequence[Sequence[float]]]]:
-    """Convert [minx, miny, maxx, maxy] to a GeoJSON polygon covering the box."""
+    """Convert [minx, miny, maxx, maxy] to a GeoJSON polygon covering the box.
+
+    Hourly partitions share the same grid, so polygons are memoized per bbox; the
+    returned mapping is shared between items and must not be mutated.
+    """
     minx, miny, maxx, maxy = bbox
     return {
         "type": "Polygon",
@@ -164,9 +251,8 @@ def bbox_to_polygon(bbox: Tuple[float, float, float, float]) -> Dict[str, Sequen
     }
 
 
-def is_partition_segment(segment: str) -> bool:
-    """Return True if the path segment looks like a Hive partition entry `name=value`."""
-    return "=" in segment and len(segment.split("=", 1)[0]) > 0
+# Hive partition segments `name=value` (the value runs to the next `/`)
+PARTITION_SEGMENT_RE = re.compile(r"(?:^|/)([^=/]+)=([^/]*)(?=/|$)")
 
 
 COLUMN_DESCRIPTIONS: Dict[str, str] = {
@@ -227,47 +313,60 @@ PLOT_VARIOGRAM_RE = re.compile(r"^variogram_(?P<component>[uv])(?P<variant>_rkt)
 def describe_plot_asset(filename: str) -> Tuple[Optional[str], Dict[str, str]]:
     """Return a human readable description and optional properties for plot assets."""
     name = filename.lower()
-    properties: Dict[str, str] = {}
-
     if name.startswith("grid_points"):
+        description, properties = describe_plot_kind("grid", None, False)
+        return description, dict(properties)
+
+    match = PLOT_VARIOGRAM_RE.match(name)
+    if match:
+        description, properties = describe_plot_kind(
+            "variogram", match.group("component"), bool(match.group("variant"))
+        )
+        return description, dict(properties)
+
+    return None, {}
+
+
+@functools.lru_cache(maxsize=256)
+def describe_plot_kind(kind: str,
+                       component: Optional[str],
+                       rkt: bool) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Build the description/properties of a plot kind; plot filenames differ only by partition."""
+    if kind == "grid":
         description = (
             "Scatter map generated by wind_interpolation.R that shows the interpolation mesh in "
             "WGS 84: interpolated nodes, original MeteoGalicia observations (drawn on top), and "
             "optional test points created in grid_module.R."
         )
-        properties["plot_type"] = "grid-mesh"
-        return description, properties
+        return description, (("plot_type", "grid-mesh"),)
 
-    match = PLOT_VARIOGRAM_RE.match(name)
-    if match:
-        component = match.group("component")
-        variant = match.group("variant")
-        component_label = {
-            "u": "zonal (u) wind component",
-            "v": "meridional (v) wind component",
-        }.get(component, component)
-        properties["plot_type"] = "variogram"
-        properties["plot_component"] = component
-        if variant:
-            description = (
-                f"Empirical semivariogram of the regression-kriging residuals for the {component_label}, "
-                "generated in regression_kriging() and saved by save_variogram_plot() "
-                "inside scripts/modules/interpolation_module.R using terrain (topo) as external drift."
-            )
-            properties["plot_variant"] = "regression-kriging"
-        else:
-            description = (
-                f"Empirical semivariogram for the {component_label} produced during ordinary kriging calibration; "
-                "save_variogram_plot() (scripts/modules/interpolation_module.R) overlays the model selected by cross-validation."
-            )
-            properties["plot_variant"] = "ordinary-kriging"
-        return description, properties
-
-    return None, properties
+    component_label = {
+        "u": "zonal (u) wind component",
+        "v": "meridional (v) wind component",
+    }.get(component, component)
+    if rkt:
+        description = (
+            f"Empirical semivariogram of the regression-kriging residuals for the {component_label}, "
+            "generated in regression_kriging() and saved by save_variogram_plot() "
+            "inside scripts/modules/interpolation_module.R using terrain (topo) as external drift."
+        )
+        variant = "regression-kriging"
+    else:
+        description = (
+            f"Empirical semivariogram for the {component_label} produced during ordinary kriging calibration; "
+            "save_variogram_plot() (scripts/modules/interpolation_module.R) overlays the model selected by cross-validation."
+        )
+        variant = "ordinary-kriging"
+    return description, (
+        ("plot_type", "variogram"),
+        ("plot_component", component),
+        ("plot_variant", variant),
+    )
 
 
 
 
+@functools.lru_cache(maxsize=None)
 def describe_column(name: str, stac_type: str) -> str:
     """Return a human readable description for a column."""
     if name in COLUMN_DESCRIPTIONS:
@@ -287,13 +386,12 @@ def deep_merge_dict(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, An
 
 
 def parse_partitions(path: PurePosixPath) -> Dict[str, str]:
-    """Extract partition key/value pairs from a relative path."""
-    parts: Dict[str, str] = {}
-    for segment in path.parts:
-        if is_partition_segment(segment):
-            key, value = segment.split("=", 1)
-            parts[key] = value
-    return parts
+    """Extract partition key/value pairs from a relative path.
+
+    Values stay strings (e.g. zero-padded `month=01`) because item ids reuse them
+    verbatim; partition_datetime does the integer conversion.
+    """
+    return dict(PARTITION_SEGMENT_RE.findall(str(path)))
 
 
 def load_geo_metadata(parquet_file: pq.ParquetFile) -> Tuple[Optional[str], Optional[Tuple[float, float, float, float]]]:
@@ -305,7 +403,7 @@ def load_geo_metadata(parquet_file: pq.ParquetFile) -> Tuple[Optional[str], Opti
         return None, None
 
     try:
-        geo_json = json.loads(raw_geo.decode("utf-8"))
+        geo_json = orjson.loads(raw_geo) if orjson is not None else json.loads(raw_geo.decode("utf-8"))
     except Exception:
         return None, None
 
@@ -323,8 +421,31 @@ def load_geo_metadata(parquet_file: pq.ParquetFile) -> Tuple[Optional[str], Opti
     return primary, bbox
 
 
+def parquet_column_index(parquet_file: Union[pq.ParquetFile, pq.FileMetaData], name: str) -> Optional[int]:
+    """Return the leaf column index of a top-level Parquet column, or None if absent."""
+    schema = parquet_file.schema
+    for idx in range(len(schema)):
+        if schema.column(idx).path == name:
+            return idx
+    return None
+
+
+def column_statistics_bounds(parquet_file: pq.ParquetFile, row_group: int, column: Optional[int]) -> Optional[Tuple[Any, Any]]:
+    """Return footer (min, max) of a column chunk when the writer stored them."""
+    if column is None:
+        return None
+    stats = parquet_file.metadata.row_group(row_group).column(column).statistics
+    if stats is None or not stats.has_min_max:
+        return None
+    return stats.min, stats.max
+
+
 def scan_lon_lat_bbox(parquet_file: pq.ParquetFile) -> Optional[Tuple[float, float, float, float]]:
-    """Compute bounding box by scanning lon/lat columns when geo metadata is absent."""
+    """Compute bounding box from lon/lat column statistics when geo metadata is absent.
+
+    Footer min/max statistics are used per row group; data pages are only read for
+    row groups written without statistics.
+    """
     candidate_lon_cols = ["lon", "longitude", "x"]
     candidate_lat_cols = ["lat", "latitude", "y"]
     schema_names = parquet_file.schema_arrow.names
@@ -333,28 +454,77 @@ def scan_lon_lat_bbox(parquet_file: pq.ParquetFile) -> Optional[Tuple[float, flo
     lat_col = next((col for col in candidate_lat_cols if col in schema_names), None)
     if not lon_col or not lat_col:
         return None
+    lon_idx = parquet_column_index(parquet_file, lon_col)
+    lat_idx = parquet_column_index(parquet_file, lat_col)
 
     min_lon = min_lat = float("inf")
     max_lon = max_lat = float("-inf")
 
     for rg in range(parquet_file.num_row_groups):
-        batch = parquet_file.read_row_group(rg, columns=[lon_col, lat_col])
-        lon_arr = batch.column(lon_col).to_numpy()
-        lat_arr = batch.column(lat_col).to_numpy()
-        if lon_arr.size == 0 or lat_arr.size == 0:
+        if parquet_file.metadata.row_group(rg).num_rows == 0:
             continue
-        min_lon = min(min_lon, float(lon_arr.min()))
-        max_lon = max(max_lon, float(lon_arr.max()))
-        min_lat = min(min_lat, float(lat_arr.min()))
-        max_lat = max(max_lat, float(lat_arr.max()))
+        lon_bounds = column_statistics_bounds(parquet_file, rg, lon_idx)
+        lat_bounds = column_statistics_bounds(parquet_file, rg, lat_idx)
+        if lon_bounds is None or lat_bounds is None:
+            batch = parquet_file.read_row_group(rg, columns=[lon_col, lat_col])
+            lon_mm = pc.min_max(batch.column(lon_col))
+            lat_mm = pc.min_max(batch.column(lat_col))
+            lon_bounds = (lon_mm["min"].as_py(), lon_mm["max"].as_py())
+            lat_bounds = (lat_mm["min"].as_py(), lat_mm["max"].as_py())
+            if None in lon_bounds or None in lat_bounds:
+                continue
+        min_lon = min(min_lon, float(lon_bounds[0]))
+        max_lon = max(max_lon, float(lon_bounds[1]))
+        min_lat = min(min_lat, float(lat_bounds[0]))
+        max_lat = max(max_lat, float(lat_bounds[1]))
 
     if min_lon == float("inf") or min_lat == float("inf"):
         return None
     return (min_lon, min_lat, max_lon, max_lat)
 
 
+def coerce_datetime(value: Any) -> Optional[datetime]:
+    """Convert a statistics or compute scalar (datetime, date or ISO string) to UTC."""
+    if isinstance(value, datetime):
+        return ensure_utc(value)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    if isinstance(value, str):
+        try:
+            return parse_datetime(value)
+        except ValueError:
+            return None
+    return None
+
+
+def statistics_datetime_bounds(parquet_file: pq.ParquetFile, name: str) -> Optional[Tuple[datetime, datetime]]:
+    """Return column min/max from footer statistics, or None if any row group lacks them."""
+    col_idx = parquet_column_index(parquet_file, name)
+    lower: Optional[datetime] = None
+    upper: Optional[datetime] = None
+    for rg in range(parquet_file.num_row_groups):
+        if parquet_file.metadata.row_group(rg).num_rows == 0:
+            continue
+        bounds = column_statistics_bounds(parquet_file, rg, col_idx)
+        if bounds is None:
+            return None
+        lo, hi = coerce_datetime(bounds[0]), coerce_datetime(bounds[1])
+        if lo is None or hi is None:
+            return None
+        lower = lo if lower is None else min(lower, lo)
+        upper = hi if upper is None else max(upper, hi)
+    if lower is None or upper is None:
+        return None
+    return lower, upper
+
+
 def read_timestamp_bounds(parquet_file: pq.ParquetFile) -> Tuple[Optional[datetime], Optional[datetime]]:
-    """Try to infer min/max datetime from timestamp/date columns in a Parquet file."""
+    """Try to infer min/max datetime from timestamp/date columns in a Parquet file.
+
+    Footer statistics are preferred. Columns without statistics are read, string
+    columns are cast to timestamps, and the result is reduced with Arrow compute;
+    values are parsed one by one only when the cast rejects the column.
+    """
     schema = parquet_file.schema_arrow
     col_candidates = [
         ("timestamp",),
@@ -385,24 +555,40 @@ def read_timestamp_bounds(parquet_file: pq.ParquetFile) -> Tuple[Optional[dateti
                     continue
         return parsed
 
+    def column_bounds(data, name: str) -> Optional[Tuple[datetime, datetime]]:
+        column = data.column(name)
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            # ISO-8601 strings are parsed by Arrow's cast kernel: offset-qualified values
+            # (e.g. trailing Z) as UTC, naive ones as UTC wall time.
+            for target in (pa.timestamp("us", tz="UTC"), pa.timestamp("us")):
+                try:
+                    column = pc.cast(column, target)
+                    break
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    continue
+        if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+            result = pc.min_max(column)
+            lo, hi = coerce_datetime(result["min"].as_py()), coerce_datetime(result["max"].as_py())
+            if lo is None or hi is None:
+                return None
+            return lo, hi
+        values = parse_array(column.to_pylist())
+        if not values:
+            return None
+        return min(values), max(values)
+
     for names in present:
-        if len(names) == 2:
-            first_col, last_col = names
-            data = parquet_file.read_row_groups(
-                list(range(parquet_file.num_row_groups)), columns=list(names)
-            )
-            first_values = parse_array(data.column(first_col).to_pylist())
-            last_values = parse_array(data.column(last_col).to_pylist())
-            if first_values and last_values:
-                return min(first_values), max(last_values)
-        else:
-            col = names[0]
-            data = parquet_file.read_row_groups(
-                list(range(parquet_file.num_row_groups)), columns=[col]
-            )
-            values = parse_array(data.column(col).to_pylist())
-            if values:
-                return min(values), max(values)
+        stats_bounds = [statistics_datetime_bounds(parquet_file, name) for name in names]
+        if all(bounds is not None for bounds in stats_bounds):
+            return stats_bounds[0][0], stats_bounds[-1][1]  # type: ignore[index]
+
+        data = parquet_file.read(columns=list(names), use_threads=True)
+        first_bounds = column_bounds(data, names[0])
+        last_bounds = column_bounds(data, names[-1])
+        if first_bounds and last_bounds:
+            return first_bounds[0], last_bounds[1]
     return None, None
 
 
@@ -425,6 +611,34 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def read_json_file(path: Path) -> Any:
+    """Parse a JSON document from disk, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialise a JSON document with two-space indentation, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def write_json_file(path: Path, data: Any) -> None:
+    """Write a JSON document with two-space indentation."""
+    path.write_bytes(dump_json_bytes(data))
+
+
+def write_file_bytes(path: Path, payload: bytes) -> None:
+    """Write an already serialised document, creating its parent directory."""
+    ensure_dir(str(path.parent))
+    path.write_bytes(payload)
+
+
 def format_datetime(dt: Optional[datetime]) -> Optional[str]:
     """Return ISO string with Z suffix, or None."""
     if dt is None:
@@ -439,97 +653,216 @@ class AssetRecord:
     bbox: Optional[Tuple[float, float, float, float]]
     start: Optional[datetime]
     end: Optional[datetime]
-    row_count: int
+    row_count: Optional[int]
     primary_geom: Optional[str]
+    # Parsed footer from discovery, reused when the file is reopened to build its item
+    metadata: Optional[pq.FileMetaData] = field(default=None, repr=False)
 
 
-def discover_assets(fs: pafs.FileSystem, base_path: str, extension_filter: Iterable[str]) -> List[AssetRecord]:
-    """Walk the filesystem and collect asset metadata."""
+@dataclass
+class RecordInputs:
+    """Filesystem results for one record, gathered off the main thread before building items."""
+    item_id: str = ""
+    source_model: Optional[Any] = None
+    columns: List[Tuple[str, str, str]] = field(default_factory=list)
+    local_parquet_path: Optional[Path] = None
+    parquet_copy_failed: bool = False
+    metadata_exists: bool = False
+    local_metadata_path: Optional[Path] = None
+    # (relative plot path, local copy or None) for each PNG to catalog
+    plots: List[Tuple[PurePosixPath, Optional[Path]]] = field(default_factory=list)
+
+
+def inspect_asset(fs: pafs.FileSystem, base_path: str, path: str) -> AssetRecord:
+    """Read footer metadata of one partition file into an AssetRecord.
+
+    Besides plain Python values, the record keeps only the parsed footer (no data
+    pages), and the reader is closed before returning.
+    """
+    rel_path = relative_from_base(path, base_path)
+    partitions = parse_partitions(rel_path)
+    source = None
+    pf = None
+    try:
+        source = fs.open_input_file(path)
+        # Opening only parses the footer (pq.read_metadata does the same internally);
+        # column readers are created solely by the fallback reads in the helpers.
+        pf = pq.ParquetFile(source)
+        primary_geom, bbox = load_geo_metadata(pf)
+        if bbox is None:
+            bbox = scan_lon_lat_bbox(pf)
+        start, end = read_timestamp_bounds(pf)
+        if start is None or end is None:
+            start_part, end_part = partition_datetime(partitions)
+            start = start or start_part
+            end = end or end_part
+        return AssetRecord(
+            relative_path=rel_path,
+            partitions=partitions,
+            bbox=bbox,
+            start=ensure_utc(start),
+            end=ensure_utc(end),
+            row_count=pf.metadata.num_rows if pf.metadata else 0,
+            primary_geom=primary_geom,
+            metadata=pf.metadata,
+        )
+    finally:
+        try:
+            if pf is not None:
+                pf.close()
+            if source is not None:
+                source.close()
+        except Exception:
+            pass
+
+
+def discover_assets(fs: pafs.FileSystem,
+                    base_path: str,
+                    extension_filter: Iterable[str],
+                    io_concurrency: int = DEFAULT_IO_CONCURRENCY,
+                    trust_partitions: bool = False,
+                    sample_files: int = 1) -> List[AssetRecord]:
+    """Walk the filesystem and collect asset metadata.
+
+    Footers are read by a thread pool; PyArrow releases the GIL during I/O, so
+    requests to remote filesystems overlap. With trust_partitions, files whose
+    year/month/day/hour partitions fix the timestamp are not opened: they reuse
+    the bbox and geometry column of the first `sample_files` files and carry no
+    row count.
+    """
     try:
         selector = pafs.FileSelector(base_dir=base_path, recursive=True)
     except TypeError:
         # PyArrow < 13 uses positional arguments (base_dir, recursive, allow_not_found)
         selector = pafs.FileSelector(base_path, True)
-    records: List[AssetRecord] = []
 
-    for info in fs.get_file_info(selector):
-        if info.type != pafs.FileType.File:
-            continue
-        if not any(info.path.endswith(ext) for ext in extension_filter):
-            continue
-
-        rel_path = PurePosixPath(os.path.relpath(info.path, base_path))
-        partitions = parse_partitions(rel_path)
-        pf = None
-        try:
-            pf = pq.ParquetFile(info.path, filesystem=fs)
-            primary_geom, bbox = load_geo_metadata(pf)
-            if bbox is None:
-                bbox = scan_lon_lat_bbox(pf)
-            start, end = read_timestamp_bounds(pf)
-            if start is None or end is None:
-                start_part, end_part = partition_datetime(partitions)
-                start = start or start_part
-                end = end or end_part
-            records.append(
-                AssetRecord(
+    file_infos = sorted(
+        (
+            info
+            for info in fs.get_file_info(selector)
+            if info.type == pafs.FileType.File
+            and any(info.path.endswith(ext) for ext in extension_filter)
+        ),
+        key=lambda info: info.path,
+    )
+    with ThreadPoolExecutor(max_workers=max(1, io_concurrency)) as executor:
+        if not trust_partitions:
+            records = list(executor.map(lambda info: inspect_asset(fs, base_path, info.path), file_infos))
+        else:
+            sample_count = max(1, sample_files)
+            records = list(
+                executor.map(lambda info: inspect_asset(fs, base_path, info.path), file_infos[:sample_count])
+            )
+            sample_bbox: Optional[Tuple[float, float, float, float]] = None
+            for record in records:
+                sample_bbox = merge_bbox(sample_bbox, record.bbox)
+            sample_geom = next((r.primary_geom for r in records if r.primary_geom), None)
+
+            def from_partitions(info: pafs.FileInfo) -> AssetRecord:
+                rel_path = relative_from_base(info.path, base_path)
+                partitions = parse_partitions(rel_path)
+                start, _ = partition_datetime(partitions)
+                # Only an hour partition pins the interval; others are read from the footer
+                if start is None or "hour" not in partitions:
+                    return inspect_asset(fs, base_path, info.path)
+                return AssetRecord(
                     relative_path=rel_path,
                     partitions=partitions,
-                    bbox=bbox,
-                    start=ensure_utc(start),
-                    end=ensure_utc(end),
-                    row_count=pf.metadata.num_rows if pf.metadata else 0,
-                    primary_geom=primary_geom,
+                    bbox=sample_bbox,
+                    # Hourly files hold one timestamp, so the footer path reports
+                    # end == start; use the same instant rather than start + 1h
+                    start=start,
+                    end=start,
+                    row_count=None,
+                    primary_geom=sample_geom,
                 )
-            )
-        finally:
-            try:
-                if pf is not None:
-                    pf.close()
-            except Exception:
-                pass
+
+            records.extend(executor.map(from_partitions, file_infos[sample_count:]))
     records.sort(key=lambda r: str(r.relative_path))
     return records
 
 
-def load_existing_items(catalog_dir: Path, allowed_years: Optional[Set[str]] = None) -> List[Item]:
-    """Load previously generated STAC items from a catalog directory.
-
-    When allowed_years is provided, only items whose IDs start with one of those
-    years are loaded to reduce I/O.
-    """
-    catalog_path = catalog_dir / "catalog.json"
-    if not catalog_path.exists():
+def list_item_ids(items_root: Path) -> List[str]:
+    """Return the IDs of the items stored under ``<items_root>/<item-id>/``, sorted."""
+    try:
+        with os.scandir(items_root) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+    except FileNotFoundError:
         return []
 
-    def item_matches(path: Path) -> bool:
-        if not allowed_years:
-            return True
-        stem = path.stem
-        return any(stem.startswith(year) for year in allowed_years)
-
-    # Fast path: manual scan of item JSONs to avoid loading the entire tree.
-    if allowed_years:
-        items: List[Item] = []
-        for item_file in sorted(catalog_dir.glob("**/*.json")):
-            if item_file.name == "catalog.json":
-                continue
-            if not item_matches(item_file):
-                continue
-            try:
-                items.append(Item.from_file(str(item_file)))
-            except Exception:
-                continue
-        return items
 
+def load_existing_items(items_root: Path, allowed_years: Optional[Set[str]] = None) -> List[Item]:
+    """Load previously generated STAC items from an item directory.
+
+    Items are read straight from the ``<item-id>/<item-id>.json`` layout instead of
+    walking the catalog link graph. When allowed_years is provided, only items whose
+    IDs start with one of those years are loaded to reduce I/O.
+    """
     try:
-        catalog = Catalog.from_file(str(catalog_path))
-    except Exception as exc:
-        sys.stderr.write(
-            f"Warning: unable to load existing catalog at {catalog_path}: {exc}\n"
-        )
+        item_ids = list_item_ids(items_root)
+    except OSError as exc:
+        sys.stderr.write(f"Warning: unable to list existing items in {items_root}: {exc}\n")
         return []
-    return list(catalog.get_items())
+
+    items: List[Item] = []
+    for item_id in item_ids:
+        if allowed_years and not any(item_id.startswith(year) for year in allowed_years):
+            continue
+        item_file = items_root / item_id / f"{item_id}.json"
+        try:
+            # Items come from this builder, so STAC version migration is unnecessary
+            item = Item.from_dict(
+                read_json_file(item_file),
+                href=str(item_file),
+                migrate=False,
+                preserve_dict=False,
+            )
+        except Exception:
+            continue
+        item.set_self_href(str(item_file))
+        items.append(item)
+    return items
+
+
+def item_href(kind: str, item_id: str) -> str:
+    """Relative href from one item JSON to an item of another kind (parquet/metadata/plots)."""
+    return f"../../{kind}/{item_id}/{item_id}.json"
+
+
+def write_item(item: Item, items_root: Path, writer: Optional[ThreadPoolExecutor] = None) -> Optional[Future]:
+    """Write an item to ``<items_root>/<item-id>/<item-id>.json`` with its catalog links.
+
+    The item is serialised on the calling thread; when a writer pool is given the file
+    write is handed to it and the returned future reports its outcome.
+    """
+    item_dict = item.to_dict(include_self_link=False, transform_hrefs=False)
+    item_dict["links"] = [*ITEM_HIERARCHY_LINKS, *item_dict.get("links", [])]
+    item_path = items_root / item.id / f"{item.id}.json"
+    payload = dump_json_bytes(item_dict)
+    if writer is None:
+        write_file_bytes(item_path, payload)
+        return None
+    return writer.submit(write_file_bytes, item_path, payload)
+
+
+def write_subcatalog(catalog: Catalog, items_root: Path, item_ids: Sequence[str]) -> None:
+    """Write ``<items_root>/catalog.json`` linking every item directory under it."""
+    catalog_dict: Dict[str, Any] = {
+        "type": "Catalog",
+        "id": catalog.id,
+        "stac_version": pystac.get_stac_version(),
+        "description": catalog.description,
+        "links": [
+            *SUBCATALOG_HIERARCHY_LINKS,
+            *(
+                {"rel": "item", "href": f"./{item_id}/{item_id}.json", "type": "application/geo+json"}
+                for item_id in item_ids
+            ),
+        ],
+    }
+    if catalog.title:
+        catalog_dict["title"] = catalog.title
+    write_json_file(items_root / "catalog.json", catalog_dict)
 
 
 # ---------------------------------------------------------------------------
@@ -569,70 +902,159 @@ def create_collection(args: argparse.Namespace) -> Collection:
     return collection
 
 
-def update_collection_extent(collection: Collection,
-                             bbox: Optional[Tuple[float, float, float, float]],
-                             start: Optional[datetime],
-                             end: Optional[datetime]) -> None:
-    """Update the collection extent accumulators from an individual item."""
-    extent = collection.extent
-    if bbox:
-        existing = extent.spatial.bboxes[0]
-        if existing[0] != existing[0]:  # NaN check
-            extent.spatial.bboxes[0] = list(bbox)
-        else:
-            extent.spatial.bboxes[0] = list(merge_bbox(tuple(existing), bbox))  # type: ignore[arg-type]
-    start = ensure_utc(start)
-    end = ensure_utc(end)
-    temporal = extent.temporal.intervals[0]
-    if start:
-        if temporal[0] is None or start < temporal[0]:
-            temporal[0] = start
-    if end:
-        if temporal[1] is None or end > temporal[1]:
-            temporal[1] = end
-
-
-def attach_table_metadata(item: Item, parquet_file: pq.ParquetFile) -> None:
-    """Populate the STAC table extension with column metadata."""
-    schema = parquet_file.schema_arrow
-    columns = []
-    for field in schema:
-        pa_type = field.type
-        if pa.types.is_integer(pa_type):
-            stac_type = "integer"
-        elif pa.types.is_floating(pa_type):
-            stac_type = "number"
-        elif pa.types.is_boolean(pa_type):
-            stac_type = "boolean"
-        elif pa.types.is_timestamp(pa_type):
-            stac_type = "datetime"
-        elif pa.types.is_date(pa_type):
-            stac_type = "date"
-        elif pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type):
-            stac_type = "string"
-        else:
-            stac_type = "string"
-        description = describe_column(field.name, stac_type)
-        try:
-            columns.append(Column(field.name, stac_type, description=description))
-        except TypeError:
-            # Column signature may vary; attempt alternate positional call or fallback to dict.
-            try:
-                columns.append(Column(field.name, stac_type, description))
-            except TypeError:
-                columns.append(
-                    {
-                        "name": field.name,
-                        "type": stac_type,
-                        "description": description,
-                    }
-                )
+class ExtentAccumulator:
+    """Track running bbox/datetime extrema of items, then fold them into the collection once."""
+
+    def __init__(self) -> None:
+        self.bbox = [math.inf, math.inf, -math.inf, -math.inf]
+        self.start: Optional[datetime] = None
+        self.end: Optional[datetime] = None
+
+    def add(self,
+            bbox: Optional[Sequence[float]],
+            start: Optional[datetime],
+            end: Optional[datetime]) -> None:
+        if bbox:
+            acc = self.bbox
+            if bbox[0] < acc[0]:
+                acc[0] = bbox[0]
+            if bbox[1] < acc[1]:
+                acc[1] = bbox[1]
+            if bbox[2] > acc[2]:
+                acc[2] = bbox[2]
+            if bbox[3] > acc[3]:
+                acc[3] = bbox[3]
+        start = ensure_utc(start)
+        end = ensure_utc(end)
+        if start and (self.start is None or start < self.start):
+            self.start = start
+        if end and (self.end is None or end > self.end):
+            self.end = end
+
+    def apply(self, collection: Collection) -> None:
+        """Merge the accumulated extents with the collection's current extent."""
+        extent = collection.extent
+        if self.bbox[0] != math.inf:
+            merged = tuple(self.bbox)
+            existing = extent.spatial.bboxes[0]
+            if existing[0] != existing[0]:  # NaN check
+                extent.spatial.bboxes[0] = list(merged)
+            else:
+                extent.spatial.bboxes[0] = list(merge_bbox(tuple(existing), merged))  # type: ignore[arg-type]
+        temporal = extent.temporal.intervals[0]
+        if self.start and (temporal[0] is None or self.start < temporal[0]):
+            temporal[0] = self.start
+        if self.end and (temporal[1] is None or self.end > temporal[1]):
+            temporal[1] = self.end
+
+
+def schema_fingerprint(schema: pa.Schema) -> bytes:
+    """Return a short digest identifying an Arrow schema (fields and metadata)."""
+    return hashlib.blake2b(schema.serialize().to_pybytes(), digest_size=16).digest()
+
+
+# STAC table types by Arrow type id; anything unlisted (dictionaries, binary, ...) is "string"
+ARROW_TYPE_TO_STAC: Dict[int, str] = {
+    **{t.id: "integer" for t in (pa.int8(), pa.int16(), pa.int32(), pa.int64(),
+                                 pa.uint8(), pa.uint16(), pa.uint32(), pa.uint64())},
+    **{t.id: "number" for t in (pa.float16(), pa.float32(), pa.float64())},
+    pa.bool_().id: "boolean",
+    pa.timestamp("ns").id: "datetime",
+    pa.date32().id: "date",
+    pa.date64().id: "date",
+    pa.string().id: "string",
+    pa.large_string().id: "string",
+}
+
+
+# Partitions of one dataset share a schema: resolve its (name, type, description) once
+_TABLE_COLUMNS_CACHE: Dict[bytes, List[Tuple[str, str, str]]] = {}
+
+
+def table_column_specs(schema: pa.Schema) -> List[Tuple[str, str, str]]:
+    """Return (name, STAC type, description) for each field, cached by schema."""
+    key = schema_fingerprint(schema)
+    cached = _TABLE_COLUMNS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    specs = []
+    for arrow_field in schema:
+        stac_type = ARROW_TYPE_TO_STAC.get(arrow_field.type.id, "string")
+        specs.append((arrow_field.name, stac_type, describe_column(arrow_field.name, stac_type)))
+    _TABLE_COLUMNS_CACHE[key] = specs
+    return specs
+
+
+def resolve_column_factory() -> Callable[[str, str, str], Any]:
+    """Pick the table Column constructor form supported by the installed pystac.
+
+    The Column signature varies between pystac releases; the first form that
+    accepts (name, type, description) is used, with a plain dict as fallback.
+    """
+    try:
+        Column("name", "string", description="description")
+        return lambda name, stac_type, description: Column(name, stac_type, description=description)
+    except TypeError:
+        pass
+    try:
+        Column("name", "string", "description")
+        return lambda name, stac_type, description: Column(name, stac_type, description)
+    except TypeError:
+        pass
+    return lambda name, stac_type, description: {
+        "name": name,
+        "type": stac_type,
+        "description": description,
+    }
+
+
+make_column = resolve_column_factory()
+
+
+def attach_table_metadata(item: Item, column_specs: Sequence[Tuple[str, str, str]]) -> None:
+    """Populate the STAC table extension from (name, type, description) column specs."""
+    columns = [
+        make_column(name, stac_type, description)
+        for name, stac_type, description in column_specs
+    ]
     table_ext = TableExtension.ext(item, add_if_missing=True)
     table_ext.columns = columns
 
 
+def footer_source_model(metadata: pq.FileMetaData) -> Optional[Any]:
+    """Return source_model from the footer key/value metadata, else from column statistics."""
+    key_value = metadata.metadata or {}
+    raw = key_value.get(b"source_model")
+    if raw:
+        return raw.decode("utf-8")
+    return statistics_constant_value(metadata, "source_model")
+
+
+def statistics_constant_value(metadata: pq.FileMetaData, column_name: str) -> Optional[Any]:
+    """Return a column's value when first row-group statistics prove it constant, else None."""
+    if metadata.num_row_groups == 0:
+        return None
+    col_idx = parquet_column_index(metadata, column_name)
+    if col_idx is None:
+        return None
+    stats = metadata.row_group(0).column(col_idx).statistics
+    if (
+        stats is not None
+        and stats.has_min_max
+        and stats.has_null_count
+        and stats.null_count == 0
+        and stats.min == stats.max
+    ):
+        return stats.min
+    return None
+
+
 def read_constant_column(parquet_file: pq.ParquetFile, column_name: str) -> Optional[Any]:
-    """Return the first value of a Parquet column without loading the full dataset."""
+    """Return the first value of a Parquet column without loading the full dataset.
+
+    Constant columns are answered from the first row group's footer statistics
+    (min == max, no nulls) without decoding any page.
+    """
     try:
         schema = parquet_file.schema_arrow
         if schema.get_field_index(column_name) == -1:
@@ -640,6 +1062,10 @@ def read_constant_column(parquet_file: pq.ParquetFile, column_name: str) -> Opti
     except AttributeError:
         return None
 
+    value = statistics_constant_value(parquet_file.metadata, column_name)
+    if value is not None:
+        return value
+
     try:
         row_group = parquet_file.read_row_group(0, columns=[column_name])
     except (IndexError, OSError, ValueError):
@@ -658,18 +1084,133 @@ def read_constant_column(parquet_file: pq.ParquetFile, column_name: str) -> Opti
         return None
 
 
+# Top-level Item keys that only the to_dict/from_dict round trip can override
+ITEM_CORE_FIELDS = frozenset(
+    {"type", "stac_version", "id", "geometry", "bbox", "links", "properties", "assets", "stac_extensions", "collection"}
+)
+
+
+# (key path, value) assignment produced by flattening a nested override
+OverrideOp = Tuple[Tuple[str, ...], Any]
+
+
+def compile_override_ops(patch: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> List[OverrideOp]:
+    """Flatten a nested override mapping into key-path assignments."""
+    ops: List[OverrideOp] = []
+    for key, value in patch.items():
+        if isinstance(value, dict) and value:
+            ops.extend(compile_override_ops(value, prefix + (key,)))
+        else:
+            ops.append((prefix + (key,), value))
+    return ops
+
+
+def apply_override_ops(target: Dict[str, Any], ops: Sequence[OverrideOp]) -> None:
+    """Apply flattened overrides to target in place, with deep_merge_dict semantics.
+
+    Nested mappings along each path are copied before being written, so dictionaries
+    shared with other items are never mutated.
+    """
+    for path, value in ops:
+        current = target
+        for key in path[:-1]:
+            child = current.get(key)
+            child = dict(child) if isinstance(child, dict) else {}
+            current[key] = child
+            current = child
+        last = path[-1]
+        if isinstance(value, dict):
+            # An empty mapping only guarantees that a mapping exists at this key
+            if not isinstance(current.get(last), dict):
+                current[last] = {}
+        else:
+            current[last] = value
+
+
+@dataclass
+class ItemOverridePlan:
+    """Item overrides split once per run into parts that can be applied to Items in place."""
+    overrides: Dict[str, Any]
+    property_ops: List[OverrideOp] = field(default_factory=list)
+    assets: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    extra_field_ops: List[OverrideOp] = field(default_factory=list)
+    stac_extensions: Optional[List[str]] = None
+    collection_id: Optional[str] = None
+    in_place: bool = True
+
+
+def compile_item_overrides(overrides: Dict[str, Any]) -> ItemOverridePlan:
+    """Classify item overrides by the Item attribute they patch."""
+    plan = ItemOverridePlan(overrides=overrides)
+    for key, value in overrides.items():
+        if key in ("properties", "assets") and not value:
+            continue
+        if key == "properties" and isinstance(value, dict) and "datetime" not in value:
+            plan.property_ops = compile_override_ops(value)
+        elif key == "assets" and isinstance(value, dict) and all(isinstance(v, dict) for v in value.values()):
+            plan.assets = value
+        elif key == "stac_extensions" and isinstance(value, list):
+            plan.stac_extensions = list(value)
+        elif key == "collection" and isinstance(value, str):
+            plan.collection_id = value
+        elif key not in ITEM_CORE_FIELDS:
+            plan.extra_field_ops.extend(compile_override_ops({key: value}))
+        else:
+            plan.in_place = False
+    return plan
+
+
+def apply_item_overrides(item: Item, plan: ItemOverridePlan) -> Item:
+    """Deep-merge user overrides into an Item, keeping the generated asset hrefs.
+
+    Overrides of properties, assets, extensions, collection and extra fields (the
+    usual case) are applied in place; anything touching the Item structure goes
+    through a full to_dict/from_dict round trip.
+    """
+    if plan.in_place:
+        apply_override_ops(item.properties, plan.property_ops)
+        for key, asset_patch in plan.assets.items():
+            if key in item.assets:
+                merged_asset = deep_merge_dict(item.assets[key].to_dict(), asset_patch)
+            else:
+                merged_asset = asset_patch
+            item.add_asset(key, Asset.from_dict(merged_asset))
+        apply_override_ops(item.extra_fields, plan.extra_field_ops)
+        if plan.stac_extensions is not None:
+            item.stac_extensions = list(plan.stac_extensions)
+        if plan.collection_id is not None:
+            item.collection_id = plan.collection_id
+        return item
+
+    base_dict = item.to_dict(include_self_link=False)
+    original_asset_hrefs = {
+        key: asset.get("href") for key, asset in base_dict.get("assets", {}).items()
+    }
+    merged_dict = deep_merge_dict(base_dict, plan.overrides)
+    for key, href in original_asset_hrefs.items():
+        if key in merged_dict.get("assets", {}) and "href" not in merged_dict["assets"][key] and href is not None:
+            merged_dict["assets"][key]["href"] = href
+    return Item.from_dict(merged_dict)
+
+
 def build_items_and_collection(
     args: argparse.Namespace,
     item_overrides: Optional[Dict[str, Any]] = None,
     collection_overrides: Optional[Dict[str, Any]] = None,
     allowed_years: Optional[Set[str]] = None,
-) -> Collection:
-    """Main builder coordinating discovery, item creation, and collection save."""
-    try:
-        fs, base_path = pafs.FileSystem.from_uri(args.input_root)
-    except ValueError:
-        fs = pafs.LocalFileSystem()
-        base_path = args.input_root
+) -> Tuple[Collection, Dict[str, int]]:
+    """Main builder coordinating discovery, item creation, and collection save.
+
+    Returns the collection together with the number of items per subcatalog kind.
+    """
+    item_override_plan = compile_item_overrides(item_overrides) if item_overrides else None
+    fs, base_path = resolve_fs_and_base(args.input_root)
+    io_concurrency = getattr(args, "io_concurrency", None)
+    if not io_concurrency:
+        io_concurrency = (
+            DEFAULT_IO_CONCURRENCY if isinstance(fs, pafs.LocalFileSystem) else DEFAULT_REMOTE_IO_CONCURRENCY
+        )
+    io_concurrency = max(1, io_concurrency)
 
     metadata_fs: Optional[pafs.FileSystem] = None
     metadata_base: Optional[str] = None
@@ -682,12 +1223,22 @@ def build_items_and_collection(
         plots_fs, plots_base = resolve_fs_and_base(args.plots_prefix)
     copy_assets = bool(getattr(args, "copy_assets", False))
     asset_href_prefix = args.asset_href_prefix
+    data_hrefs = HrefBuilder(asset_href_prefix or args.input_root)
+    metadata_hrefs = HrefBuilder(args.metadata_prefix or asset_href_prefix or args.input_root)
+    plot_hrefs = HrefBuilder(args.plots_prefix or asset_href_prefix or args.input_root)
 
     info = fs.get_file_info(base_path)
     if info.type != pafs.FileType.Directory:
         sys.exit(f"Input root {args.input_root} is not a directory or prefix.")
 
-    records = discover_assets(fs, base_path, extension_filter=(".parquet", ".geoparquet"))
+    records = discover_assets(
+        fs,
+        base_path,
+        extension_filter=(".parquet", ".geoparquet"),
+        io_concurrency=io_concurrency,
+        trust_partitions=bool(getattr(args, "trust_partitions", False)),
+        sample_files=getattr(args, "sample_files", 1),
+    )
     if not records:
         sys.exit(f"No GeoParquet assets found under {args.input_root}.")
 
@@ -721,15 +1272,12 @@ def build_items_and_collection(
         title="Plot Assets",
     )
 
-    has_parquet = False
-    has_metadata = False
-    has_plots = False
     discovered_models: Set[str] = set()
     if getattr(args, "incremental", False):
         existing_collection_path = Path(args.output_dir) / "collection.json"
         if existing_collection_path.exists():
             try:
-                existing_coll = json.loads(existing_collection_path.read_text(encoding="utf-8"))
+                existing_coll = read_json_file(existing_collection_path)
             except (OSError, json.JSONDecodeError):
                 existing_coll = None
             if existing_coll:
@@ -740,61 +1288,155 @@ def build_items_and_collection(
     parquet_items_root = Path(args.output_dir) / "items" / "parquet"
     metadata_items_root = Path(args.output_dir) / "items" / "metadata"
     plots_items_root = Path(args.output_dir) / "items" / "plots"
-    parquet_catalog_root = Path(args.output_dir) / f"{args.collection_id}-parquet"
-    metadata_catalog_root = Path(args.output_dir) / f"{args.collection_id}-metadata"
-    plots_catalog_root = Path(args.output_dir) / f"{args.collection_id}-plots"
+    # Copied assets sit at a fixed offset from their items (../../../assets/<kind>/)
+    parquet_asset_prefix = item_dir_prefix(parquet_assets_root, parquet_items_root)
+    metadata_asset_prefix = item_dir_prefix(metadata_assets_root, metadata_items_root)
+    plot_asset_prefix = item_dir_prefix(plots_assets_root, plots_items_root)
 
     existing_parquet_ids: Set[str] = set()
     existing_metadata_ids: Set[str] = set()
     existing_plot_ids: Set[str] = set()
+    extent_accumulator = ExtentAccumulator()
 
     if getattr(args, "incremental", False):
         for existing_item in load_existing_items(parquet_items_root, allowed_years):
-            parquet_catalog.add_item(existing_item)
-            has_parquet = True
             existing_parquet_ids.add(existing_item.id)
             bbox_tuple = tuple(existing_item.bbox) if existing_item.bbox else None
             cm = existing_item.common_metadata
-            update_collection_extent(collection, bbox_tuple, cm.start_datetime, cm.end_datetime)
+            extent_accumulator.add(bbox_tuple, cm.start_datetime, cm.end_datetime)
             if isinstance(existing_item.properties, dict):
                 source_model = existing_item.properties.get("source_model")
                 if source_model:
                     discovered_models.add(str(source_model))
-        for existing_item in load_existing_items(metadata_items_root, allowed_years):
-            metadata_catalog.add_item(existing_item)
-            has_metadata = True
-            existing_metadata_ids.add(existing_item.id)
-        for existing_item in load_existing_items(plots_items_root, allowed_years):
-            plots_catalog.add_item(existing_item)
-            has_plots = True
-            existing_plot_ids.add(existing_item.id)
-
-    for record in records:
+        # Sidecar and plot items are only needed by ID
+        existing_metadata_ids.update(list_item_ids(metadata_items_root))
+        existing_plot_ids.update(list_item_ids(plots_items_root))
+    else:
+        # Full rebuilds replace whatever a previous run left in the item directories
+        for items_root in (parquet_items_root, metadata_items_root, plots_items_root):
+            if items_root.exists():
+                shutil.rmtree(items_root)
+
+    incremental = bool(getattr(args, "incremental", False))
+    # Snapshots let workers skip I/O for already cataloged items; the main loop re-checks
+    known_parquet_ids = frozenset(existing_parquet_ids)
+    known_metadata_ids = frozenset(existing_metadata_ids)
+    known_plot_ids = frozenset(existing_plot_ids)
+    new_parquet_items = 0
+    new_metadata_items = 0
+    new_plot_items = 0
+
+    # One recursive listing of the plots prefix replaces a directory listing per record
+    plots_by_dir: Dict[str, List[pafs.FileInfo]] = defaultdict(list)
+    if plots_fs is not None and plots_base is not None:
+        try:
+            selector = pafs.FileSelector(base_dir=plots_base, recursive=True)
+            plot_listing = plots_fs.get_file_info(selector)
+        except OSError:
+            # Missing or unreadable plots prefix: items are built without plots
+            plot_listing = []
+        for plot_info in plot_listing:
+            if plot_info.type == pafs.FileType.File and plot_info.path.lower().endswith(".png"):
+                plots_by_dir[str(PurePosixPath(plot_info.path).parent)].append(plot_info)
+        for plot_infos in plots_by_dir.values():
+            plot_infos.sort(key=lambda plot_info: plot_info.path)
+
+    def gather_inputs(record: AssetRecord) -> Optional[RecordInputs]:
+        """Copy assets and read Parquet/sidecar/plot information for one record."""
         item_id = make_item_id(record)
-        bbox = record.bbox
-        if bbox is None:
-            sys.stderr.write(
-                f"Warning: asset {record.relative_path} does not provide a bounding box; "
-                "item geometry will be omitted.\n"
-            )
-        geom = bbox_to_polygon(bbox) if bbox else None
-        dt = record.start or record.end
-
-        if getattr(args, "incremental", False) and item_id in existing_parquet_ids:
-            # Asset already cataloged; skip heavy copy and rebuild.
-            continue
+        if incremental and item_id in known_parquet_ids:
+            return None
+        inputs = RecordInputs(item_id=item_id)
 
         source_parquet_path = os.path.join(base_path, str(record.relative_path))
-        local_parquet_path: Optional[Path] = None
-        pf: Optional[pq.ParquetFile] = None
-        try:
-            if copy_assets:
-                local_parquet_path = parquet_assets_root / record.relative_path
-                if not copy_from_fs(fs, source_parquet_path, local_parquet_path):
-                    sys.exit(f"Failed to copy {source_parquet_path} into assets directory.")
+        if copy_assets:
+            local_parquet_path = parquet_assets_root / record.relative_path
+            if not copy_from_fs(fs, source_parquet_path, local_parquet_path):
+                inputs.parquet_copy_failed = True
+                return inputs
+            inputs.local_parquet_path = local_parquet_path
+
+        # The footer parsed during discovery usually answers both the column list and
+        # source_model (constant per file); the file is only reopened when it does not.
+        footer_resolved = False
+        if record.metadata is not None:
+            schema_arrow = record.metadata.schema.to_arrow_schema()
+            inputs.columns = table_column_specs(schema_arrow)
+            if "source_model" in schema_arrow.names:
+                inputs.source_model = footer_source_model(record.metadata)
+                footer_resolved = inputs.source_model is not None
+            else:
+                footer_resolved = True
+        if not footer_resolved:
+            pf: Optional[pq.ParquetFile] = None
+            try:
+                pf = pq.ParquetFile(source_parquet_path, filesystem=fs, metadata=record.metadata)
+                inputs.source_model = read_constant_column(pf, "source_model")
+                inputs.columns = table_column_specs(pf.schema_arrow)
+            finally:
+                try:
+                    if pf is not None:
+                        pf.close()
+                except Exception:
+                    pass
+
+        if metadata_fs is not None and metadata_base is not None:
+            metadata_rel = record.relative_path.parent / "metadata.json"
+            if not (incremental and f"{item_id}-metadata" in known_metadata_ids):
+                metadata_source = os.path.join(metadata_base, str(metadata_rel))
+                try:
+                    md_info = metadata_fs.get_file_info(metadata_source)
+                    inputs.metadata_exists = md_info.type == pafs.FileType.File
+                except Exception:
+                    inputs.metadata_exists = False
+                if inputs.metadata_exists and copy_assets:
+                    local_metadata_path = metadata_assets_root / metadata_rel
+                    if copy_from_fs(metadata_fs, metadata_source, local_metadata_path):
+                        inputs.local_metadata_path = local_metadata_path
 
-            pf = pq.ParquetFile(source_parquet_path, filesystem=fs)
-            source_model_value = read_constant_column(pf, "source_model")
+        if plots_by_dir:
+            plot_dir = PurePosixPath(plots_base) / record.relative_path.parent
+            for plot_info in plots_by_dir.get(str(plot_dir), []):
+                rel_plot = relative_from_base(plot_info.path, plots_base)
+                if incremental and f"{item_id}-plot-{rel_plot.stem}" in known_plot_ids:
+                    continue
+                local_plot_path: Optional[Path] = None
+                if copy_assets:
+                    local_plot_path = plots_assets_root / rel_plot
+                    if not copy_from_fs(plots_fs, plot_info.path, local_plot_path):
+                        continue
+                inputs.plots.append((rel_plot, local_plot_path))
+        return inputs
+
+    # Copies and Parquet/sidecar probes run on a thread pool (pyarrow filesystems are
+    # thread-safe); pystac items and catalogs are only touched on this thread, in order.
+    executor = ThreadPoolExecutor(max_workers=io_concurrency)
+    # Item files are written on their own pool so writes overlap with building later items
+    writer = ThreadPoolExecutor(max_workers=io_concurrency)
+    item_writes: List[Future] = []
+    try:
+        for record, inputs in zip(records, executor.map(gather_inputs, records)):
+            # Already-cataloged assets are skipped before any per-item work
+            if inputs is None:
+                continue
+            item_id = inputs.item_id
+            if incremental and item_id in existing_parquet_ids:
+                continue
+
+            bbox = record.bbox
+            if bbox is None:
+                sys.stderr.write(
+                    f"Warning: asset {record.relative_path} does not provide a bounding box; "
+                    "item geometry will be omitted.\n"
+                )
+            geom = bbox_to_polygon(bbox) if bbox else None
+            dt = record.start or record.end
+
+            if inputs.parquet_copy_failed:
+                source_parquet_path = os.path.join(base_path, str(record.relative_path))
+                sys.exit(f"Failed to copy {source_parquet_path} into assets directory.")
+
+            source_model_value = inputs.source_model
             parquet_item = Item(
                 id=item_id,
                 geometry=geom,
@@ -810,79 +1452,44 @@ def build_items_and_collection(
             if record.end:
                 parquet_item.common_metadata.end_datetime = record.end
 
-            attach_table_metadata(parquet_item, pf)
+            attach_table_metadata(parquet_item, inputs.columns)
 
             if record.row_count is not None:
                 parquet_item.properties["row_count"] = record.row_count
             if record.primary_geom:
                 parquet_item.properties["primary_geometry_column"] = record.primary_geom
-        finally:
-            try:
-                if pf is not None:
-                    pf.close()
-            except Exception:
-                pass
-
-        parquet_item_dir = Path(parquet_items_root) / item_id
-        if copy_assets and local_parquet_path is not None:
-            asset_href = os.path.relpath(local_parquet_path, parquet_item_dir).replace(os.sep, "/")
-        else:
-            href_prefix = asset_href_prefix or args.input_root
-            if href_prefix and "://" in href_prefix:
-                asset_href = build_href(href_prefix, record.relative_path)
-            elif href_prefix:
-                source_local_path = Path(href_prefix) / record.relative_path
-                try:
-                    asset_href = os.path.relpath(source_local_path, parquet_item_dir).replace(os.sep, "/")
-                except ValueError:
-                    asset_href = str(source_local_path)
-            else:
-                asset_href = str(record.relative_path)
-        parquet_item.add_asset(
-            "data",
-            Asset(
-                href=asset_href,
-                media_type="application/vnd.apache.parquet",
-                roles=["data"],
-                title="Interpolated winds GeoParquet",
-            ),
-        )
 
-        if item_overrides:
-            base_dict = parquet_item.to_dict(include_self_link=False)
-            original_asset_hrefs = {
-                key: asset.get("href") for key, asset in base_dict.get("assets", {}).items()
-            }
-            merged_dict = deep_merge_dict(base_dict, item_overrides)
-            for key, href in original_asset_hrefs.items():
-                if key in merged_dict.get("assets", {}) and "href" not in merged_dict["assets"][key] and href is not None:
-                    merged_dict["assets"][key]["href"] = href
-            parquet_item = Item.from_dict(merged_dict)
-
-        update_collection_extent(
-            collection,
-            tuple(parquet_item.bbox) if parquet_item.bbox else bbox,
-            parquet_item.common_metadata.start_datetime or record.start,
-            parquet_item.common_metadata.end_datetime or record.end,
-        )
-        parquet_catalog.add_item(parquet_item)
-        has_parquet = True
-        existing_parquet_ids.add(item_id)
-
-        if metadata_fs is not None and metadata_base is not None:
-            metadata_rel = record.relative_path.parent / "metadata.json"
-            metadata_item_id = f"{item_id}-metadata"
-            if getattr(args, "incremental", False) and metadata_item_id in existing_metadata_ids:
-                pass
+            if copy_assets and inputs.local_parquet_path is not None:
+                asset_href = parquet_asset_prefix + str(record.relative_path)
             else:
-                metadata_source = os.path.join(metadata_base, str(metadata_rel))
-                try:
-                    md_info = metadata_fs.get_file_info(metadata_source)
-                    metadata_exists = md_info.type == pafs.FileType.File
-                except Exception:
-                    metadata_exists = False
+                asset_href = data_hrefs.build(record.relative_path, parquet_items_root)
+            parquet_item.add_asset(
+                "data",
+                Asset(
+                    href=asset_href,
+                    media_type="application/vnd.apache.parquet",
+                    roles=["data"],
+                    title="Interpolated winds GeoParquet",
+                ),
+            )
 
-                if metadata_exists:
+            if item_override_plan is not None:
+                parquet_item = apply_item_overrides(parquet_item, item_override_plan)
+
+            extent_accumulator.add(
+                tuple(parquet_item.bbox) if parquet_item.bbox else bbox,
+                parquet_item.common_metadata.start_datetime or record.start,
+                parquet_item.common_metadata.end_datetime or record.end,
+            )
+            new_parquet_items += 1
+            existing_parquet_ids.add(item_id)
+
+            if metadata_fs is not None and metadata_base is not None:
+                metadata_rel = record.relative_path.parent / "metadata.json"
+                metadata_item_id = f"{item_id}-metadata"
+                if incremental and metadata_item_id in existing_metadata_ids:
+                    pass
+                elif inputs.metadata_exists:
                     metadata_item = Item(
                         id=metadata_item_id,
                         geometry=geom,
@@ -895,26 +1502,12 @@ def build_items_and_collection(
                     if record.end:
                         metadata_item.common_metadata.end_datetime = record.end
 
-                    metadata_item_dir = Path(metadata_items_root) / metadata_item_id
                     metadata_href = ""
                     if copy_assets:
-                        local_metadata_path = metadata_assets_root / metadata_rel
-                        if not copy_from_fs(metadata_fs, metadata_source, local_metadata_path):
-                            metadata_href = ""
-                        else:
-                            metadata_href = os.path.relpath(local_metadata_path, metadata_item_dir).replace(os.sep, "/")
+                        if inputs.local_metadata_path is not None:
+                            metadata_href = metadata_asset_prefix + str(metadata_rel)
                     else:
-                        href_base = args.metadata_prefix or asset_href_prefix or args.input_root
-                        if href_base and "://" in href_base:
-                            metadata_href = build_href(href_base, metadata_rel)
-                        elif href_base:
-                            source_local_path = Path(href_base) / metadata_rel
-                            try:
-                                metadata_href = os.path.relpath(source_local_path, metadata_item_dir).replace(os.sep, "/")
-                            except ValueError:
-                                metadata_href = str(source_local_path)
-                        else:
-                            metadata_href = str(metadata_rel)
+                        metadata_href = metadata_hrefs.build(metadata_rel, metadata_items_root)
 
                     if metadata_href:
                         metadata_item.add_asset(
@@ -926,24 +1519,12 @@ def build_items_and_collection(
                                 title="Interpolation metadata",
                             ),
                         )
-                        if item_overrides:
-                            base_md = metadata_item.to_dict(include_self_link=False)
-                            md_asset_hrefs = {
-                                key: asset.get("href") for key, asset in base_md.get("assets", {}).items()
-                            }
-                            merged_md = deep_merge_dict(base_md, item_overrides)
-                            for key, href in md_asset_hrefs.items():
-                                if (
-                                    key in merged_md.get("assets", {})
-                                    and "href" not in merged_md["assets"][key]
-                                    and href is not None
-                                ):
-                                    merged_md["assets"][key]["href"] = href
-                            metadata_item = Item.from_dict(merged_md)
+                        if item_override_plan is not None:
+                            metadata_item = apply_item_overrides(metadata_item, item_override_plan)
                         metadata_item.add_link(
                             Link(
                                 rel="describes",
-                                target=parquet_item,
+                                target=item_href("parquet", parquet_item.id),
                                 media_type="application/geo+json",
                                 title=parquet_item.id,
                             )
@@ -951,32 +1532,20 @@ def build_items_and_collection(
                         parquet_item.add_link(
                             Link(
                                 rel="describedby",
-                                target=metadata_item,
+                                target=item_href("metadata", metadata_item.id),
                                 media_type="application/geo+json",
                                 title=metadata_item.id,
                             )
                         )
-                        metadata_catalog.add_item(metadata_item)
+                        item_writes.append(write_item(metadata_item, metadata_items_root, writer))
+                        new_metadata_items += 1
                         existing_metadata_ids.add(metadata_item.id)
-                        has_metadata = True
 
-        if plots_fs is not None and plots_base is not None:
-            plot_dir = PurePosixPath(plots_base) / record.relative_path.parent
-            try:
-                selector = pafs.FileSelector(base_dir=str(plot_dir), recursive=False)
-                plot_infos = plots_fs.get_file_info(selector)
-            except Exception:
-                plot_infos = []
-            for plot_info in plot_infos:
-                if plot_info.type != pafs.FileType.File:
+            for rel_plot, local_plot_path in inputs.plots:
+                plot_item_id = f"{item_id}-plot-{rel_plot.stem}"
+                if incremental and plot_item_id in existing_plot_ids:
                     continue
-                if not plot_info.path.lower().endswith(".png"):
-                    continue
-                rel_plot = relative_from_base(plot_info.path, plots_base)
-                plot_item_id = f"{item_id}-plot-{PurePosixPath(rel_plot).stem}"
-                if getattr(args, "incremental", False) and plot_item_id in existing_plot_ids:
-                    continue
-                plot_filename = PurePosixPath(rel_plot).name
+                plot_filename = rel_plot.name
                 plot_description, plot_props = describe_plot_asset(plot_filename)
                 plot_item = Item(
                     id=plot_item_id,
@@ -994,25 +1563,10 @@ def build_items_and_collection(
                 if record.end:
                     plot_item.common_metadata.end_datetime = record.end
 
-                plot_item_dir = Path(plots_items_root) / plot_item_id
-                plot_href = ""
-                if copy_assets:
-                    local_plot_path = plots_assets_root / rel_plot
-                    if not copy_from_fs(plots_fs, plot_info.path, local_plot_path):
-                        continue
-                    plot_href = os.path.relpath(local_plot_path, plot_item_dir).replace(os.sep, "/")
+                if local_plot_path is not None:
+                    plot_href = plot_asset_prefix + str(rel_plot)
                 else:
-                    href_base = args.plots_prefix or asset_href_prefix or args.input_root
-                    if href_base and "://" in href_base:
-                        plot_href = build_href(href_base, PurePosixPath(rel_plot))
-                    elif href_base:
-                        plot_source_path = Path(href_base) / rel_plot
-                        try:
-                            plot_href = os.path.relpath(plot_source_path, plot_item_dir).replace(os.sep, "/")
-                        except ValueError:
-                            plot_href = str(plot_source_path)
-                    else:
-                        plot_href = str(rel_plot)
+                    plot_href = plot_hrefs.build(rel_plot, plots_items_root)
                 if not plot_href:
                     continue
                 plot_item.add_asset(
@@ -1025,20 +1579,8 @@ def build_items_and_collection(
                         description=plot_description,
                     ),
                 )
-                if item_overrides:
-                    base_plot = plot_item.to_dict(include_self_link=False)
-                    plot_asset_hrefs = {
-                        key: asset.get("href") for key, asset in base_plot.get("assets", {}).items()
-                    }
-                    merged_plot = deep_merge_dict(base_plot, item_overrides)
-                    for key, href in plot_asset_hrefs.items():
-                        if (
-                            key in merged_plot.get("assets", {})
-                            and "href" not in merged_plot["assets"][key]
-                            and href is not None
-                        ):
-                            merged_plot["assets"][key]["href"] = href
-                    plot_item = Item.from_dict(merged_plot)
+                if item_override_plan is not None:
+                    plot_item = apply_item_overrides(plot_item, item_override_plan)
                 if plot_description:
                     plot_item.properties.setdefault("plot_description", plot_description)
                 for key, value in plot_props.items():
@@ -1048,7 +1590,7 @@ def build_items_and_collection(
                 plot_item.add_link(
                     Link(
                         rel="related",
-                        target=parquet_item,
+                        target=item_href("parquet", parquet_item.id),
                         media_type="application/geo+json",
                         title=parquet_item.id,
                     )
@@ -1056,14 +1598,25 @@ def build_items_and_collection(
                 parquet_item.add_link(
                     Link(
                         rel="related",
-                        target=plot_item,
+                        target=item_href("plots", plot_item.id),
                         media_type="application/geo+json",
                         title=plot_item.id,
                     )
                 )
-                plots_catalog.add_item(plot_item)
+                item_writes.append(write_item(plot_item, plots_items_root, writer))
+                new_plot_items += 1
                 existing_plot_ids.add(plot_item.id)
-                has_plots = True
+
+            # Written last so its links to the sidecar and plot items are complete
+            item_writes.append(write_item(parquet_item, parquet_items_root, writer))
+
+        for item_write in item_writes:
+            item_write.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        writer.shutdown(wait=True)
+
+    extent_accumulator.apply(collection)
 
     ensure_dir(args.output_dir)
 
@@ -1071,30 +1624,31 @@ def build_items_and_collection(
     ensure_dir(str(collection_href.parent))
     collection.set_self_href(str(collection_href))
 
-    if has_parquet:
-        ensure_dir(str(parquet_assets_root))
-        ensure_dir(str(parquet_items_root))
-        if parquet_catalog_root.exists():
-            shutil.rmtree(parquet_catalog_root)
-        parquet_catalog.normalize_hrefs(str(parquet_catalog_root))
-        parquet_catalog.set_self_href(str(parquet_catalog_root / "catalog.json"))
-        collection.add_child(parquet_catalog)
-    if has_metadata:
-        ensure_dir(str(metadata_assets_root))
-        ensure_dir(str(metadata_items_root))
-        if metadata_catalog_root.exists():
-            shutil.rmtree(metadata_catalog_root)
-        metadata_catalog.normalize_hrefs(str(metadata_catalog_root))
-        metadata_catalog.set_self_href(str(metadata_catalog_root / "catalog.json"))
-        collection.add_child(metadata_catalog)
-    if has_plots:
-        ensure_dir(str(plots_assets_root))
-        ensure_dir(str(plots_items_root))
-        if plots_catalog_root.exists():
-            shutil.rmtree(plots_catalog_root)
-        plots_catalog.normalize_hrefs(str(plots_catalog_root))
-        plots_catalog.set_self_href(str(plots_catalog_root / "catalog.json"))
-        collection.add_child(plots_catalog)
+    # Subcatalogs list every item directory on disk; incremental runs that added
+    # nothing to one leave its catalog.json untouched.
+    child_links: List[Dict[str, Any]] = []
+    item_counts: Dict[str, int] = {}
+    subcatalogs = [
+        ("parquet", new_parquet_items, parquet_catalog, parquet_items_root, parquet_assets_root),
+        ("metadata", new_metadata_items, metadata_catalog, metadata_items_root, metadata_assets_root),
+        ("plots", new_plot_items, plots_catalog, plots_items_root, plots_assets_root),
+    ]
+    for kind, new_items, catalog, items_root, kind_assets_root in subcatalogs:
+        item_ids = list_item_ids(items_root)
+        if not item_ids:
+            continue
+        item_counts[kind] = len(item_ids)
+        ensure_dir(str(kind_assets_root))
+        if not (incremental and new_items == 0 and (items_root / "catalog.json").exists()):
+            write_subcatalog(catalog, items_root, item_ids)
+        child_links.append(
+            {
+                "rel": "child",
+                "href": f"./items/{kind}/catalog.json",
+                "type": "application/json",
+                "title": catalog.title,
+            }
+        )
 
     # Fill collection.period extras when not provided
     start, end = collection.extent.temporal.intervals[0]
@@ -1114,66 +1668,36 @@ def build_items_and_collection(
             discovered_models.update(str(v) for v in existing_models)
         collection.extra_fields["source_models"] = sorted(discovered_models)
 
-    collection.save(catalog_type=CatalogType.RELATIVE_PUBLISHED)
-    collection_json_path = Path(args.output_dir) / "collection.json"
-    try:
-        coll_data_cleanup = json.loads(collection_json_path.read_text(encoding="utf-8"))
-    except FileNotFoundError:
-        coll_data_cleanup = None
-    if coll_data_cleanup and "links" in coll_data_cleanup:
-        filtered = [link for link in coll_data_cleanup["links"] if link.get("rel") != "self"]
-        if len(filtered) != len(coll_data_cleanup["links"]):
-            coll_data_cleanup["links"] = filtered
-            collection_json_path.write_text(json.dumps(coll_data_cleanup, indent=2), encoding="utf-8")
-
-    def relocate_subcatalog(child_id: str, target_subdir: str) -> None:
-        src_dir = Path(args.output_dir) / child_id
-        if not src_dir.exists():
-            return
-        dest_dir = Path(args.output_dir) / target_subdir
-        if dest_dir.exists():
-            shutil.rmtree(dest_dir)
-        ensure_dir(str(dest_dir.parent))
-        shutil.move(str(src_dir), str(dest_dir))
-
-        catalog_path = dest_dir / "catalog.json"
-        if catalog_path.exists():
-            data = json.loads(catalog_path.read_text(encoding="utf-8"))
-            for link in data.get("links", []):
-                rel = link.get("rel")
-                if rel == "self":
-                    link["href"] = "catalog.json"
-                elif rel == "parent":
-                    link["href"] = "../../collection.json"
-                elif rel == "root":
-                    link["href"] = "../../collection.json"
-            catalog_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
-        rel_href = os.path.relpath(catalog_path, Path(args.output_dir))
-        try:
-            coll_data = json.loads((Path(args.output_dir) / "collection.json").read_text(encoding="utf-8"))
-        except FileNotFoundError:
-            return
-
-        updated = False
-        for link in coll_data.get("links", []):
-            if link.get("rel") == "child" and link.get("href") == f"./{child_id}/catalog.json":
-                link["href"] = "./" + rel_href.replace(os.sep, "/")
-                updated = True
-        if updated:
-            (Path(args.output_dir) / "collection.json").write_text(json.dumps(coll_data, indent=2), encoding="utf-8")
-
-    relocate_subcatalog(f"{args.collection_id}-parquet", "items/parquet")
-    relocate_subcatalog(f"{args.collection_id}-metadata", "items/metadata")
-    relocate_subcatalog(f"{args.collection_id}-plots", "items/plots")
+    # Written in one pass: relative root link, no self link, child links to the subcatalogs
+    collection_dict = collection.to_dict(include_self_link=False, transform_hrefs=False)
+    collection_dict["links"] = [
+        COLLECTION_ROOT_LINK,
+        *(link for link in collection_dict.get("links", []) if link.get("rel") not in ("root", "self")),
+        *child_links,
+    ]
+    write_json_file(collection_href, collection_dict)
 
-    return collection
+    return collection, item_counts
 
 
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
 
+class OrjsonStacIO(pystac.stac_io.DefaultStacIO):
+    """pystac I/O that parses and serialises catalog JSON with orjson."""
+
+    def json_loads(self, txt: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return orjson.loads(txt)
+
+    def json_dumps(self, json_dict: Dict[str, Any], *args: Any, **kwargs: Any) -> str:
+        try:
+            return orjson.dumps(json_dict, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # Values orjson cannot encode (e.g. non-string keys) keep the stdlib path
+            return super().json_dumps(json_dict, *args, **kwargs)
+
+
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate a STAC Collection for GeoParquet interpolation outputs."
@@ -1263,11 +1787,33 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=None,
         help="Comma-separated list of years to load from existing items (reduces I/O during incremental builds).",
     )
+    parser.add_argument(
+        "--io-concurrency",
+        type=int,
+        default=None,
+        help="Number of Parquet footers read in parallel during discovery "
+        f"(default: {DEFAULT_IO_CONCURRENCY} for local inputs, {DEFAULT_REMOTE_IO_CONCURRENCY} for remote ones).",
+    )
+    parser.add_argument(
+        "--trust-partitions",
+        action="store_true",
+        help="Take item datetimes from year/month/day/hour partitions without opening each file "
+        "(start and end are the partition hour, as for files read from their footers); "
+        "bbox and geometry column come from the sampled files.",
+    )
+    parser.add_argument(
+        "--sample-files",
+        type=int,
+        default=1,
+        help="Number of files opened to derive the shared bbox when --trust-partitions is set (default: 1).",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - CLI
     args = parse_args(argv)
+    if orjson is not None:
+        pystac.StacIO.set_default(OrjsonStacIO)
     if args.temporal_start:
         parse_datetime(args.temporal_start)  # validate format
     if args.temporal_end:
@@ -1298,14 +1844,18 @@ def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - CL
                 f"Failed to parse collection overrides JSON ({args.collection_overrides}): {exc}"
             )
 
-    collection = build_items_and_collection(args, overrides_dict, collection_overrides_dict, allowed_years)
+    collection, item_counts = build_items_and_collection(
+        args, overrides_dict, collection_overrides_dict, allowed_years
+    )
 
     # Report summary to user
-    total_items = len(list(collection.get_items()))
+    total_items = sum(item_counts.values())
     bbox = collection.extent.spatial.bboxes[0]
     start, end = collection.extent.temporal.intervals[0]
     print(f"STAC collection saved to {args.output_dir}")
     print(f"- Items: {total_items}")
+    for kind, count in item_counts.items():
+        print(f"  - {kind}: {count}")
     if bbox[0] == bbox[0]:  # check for NaNs
         print(f"- Spatial extent: {bbox}")
     if start or end:
@@ -8,29 +8,81 @@ This CLI:
 3) Writes a single GeoParquet with the filtered rows.
 4) Builds a new STAC collection (and item) that preserves provenance to the source catalog.
 
-GeoParquet filtering is executed via DuckDB inside the `duckdb/duckdb:latest` Docker image.
+GeoParquet filtering is executed by DuckDB in-process (Python `duckdb` module, or the
+`duckdb` CLI when the module is missing); `--use-docker` runs it inside the
+`duckdb/duckdb:latest` Docker image instead.
 """
 
 from __future__ import annotations
 
 import argparse
+import copy
 import json
 import os
+import re
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import shutil
 
 import pystac
-from pystac import Asset, CatalogType, Collection, Extent, Item, Link
+from pystac import Collection, Extent, Link
 
 try:
     import pyarrow.parquet as pq  # type: ignore
 except ImportError:
     pq = None  # pragma: no cover - optional, only used for row count
 
+try:  # optional: faster JSON parsing/serialisation when available
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Hourly partitions written by the catalog builder: assets/parquet/year=/month=/day=/hour=/data.parquet
+PARQUET_ASSET_GLOB = "**/data.parquet"
+PARTITION_TIME_RE = re.compile(r"year=(\d+)[/\\]month=(\d+)[/\\]day=(\d+)[/\\]hour=(\d+)")
+# Above this many ids the inlined CLI script probes a temp table instead of an IN list
+NODE_ID_SEMI_JOIN_THRESHOLD = 32
+NODE_FILTER_TABLE = "node_filter"
+PARQUET_ZSTD_LEVEL = 1
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+
+def read_json_file(path: Path) -> Any:
+    """Parse a JSON document from disk, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def atomic_tmp_path(path: Path) -> Path:
+    """Sibling path written first and then renamed over `path` with os.replace."""
+    return path.with_name(path.name + ".tmp")
+
+
+def write_json_file(path: Path, data: Any) -> None:
+    """Write a JSON document with two-space indentation, using orjson when available.
+
+    The document is written to a temporary sibling and renamed into place.
+    """
+    tmp_path = atomic_tmp_path(path)
+    encoded: Optional[bytes] = None
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    if encoded is not None:
+        tmp_path.write_bytes(encoded)
+    else:
+        # Stream through a buffered handle rather than materializing the whole string
+        with tmp_path.open("w", encoding="utf-8", buffering=1024 * 1024) as handle:
+            json.dump(data, handle, indent=2)
+    os.replace(tmp_path, path)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -104,17 +156,26 @@ def parse_args() -> argparse.Namespace:
         "--item-id",
         help="ID for the derived item (defaults to <collection-id>-subset).",
     )
+    parser.add_argument(
+        "--duckdb-memory-limit",
+        help="Memory limit passed to DuckDB (e.g. 8GB); defaults to DuckDB's own limit (80%% of RAM).",
+    )
+    parser.add_argument(
+        "--use-docker",
+        action="store_true",
+        help="Run DuckDB inside a Docker container instead of in-process (falls back to local DuckDB on failure).",
+    )
     parser.add_argument(
         "--mount-root",
         help=(
-            "Host path to mount into the DuckDB container; must enclose source assets and output. "
-            "If omitted, the script will compute a common ancestor."
+            "With --use-docker, host path to mount into the DuckDB container; must enclose source "
+            "assets and output. If omitted, the script will compute a common ancestor."
         ),
     )
     parser.add_argument(
         "--duckdb-image",
         default="duckdb/duckdb:latest",
-        help="Docker image used to run DuckDB (default: duckdb/duckdb:latest).",
+        help="Docker image used to run DuckDB with --use-docker (default: duckdb/duckdb:latest).",
     )
     parser.add_argument(
         "--skip-source-items",
@@ -155,7 +216,7 @@ def read_node_ids(args: argparse.Namespace) -> List[str]:
 
 def load_geometry_filter(args: argparse.Namespace) -> Optional[str]:
     if args.geometry_file:
-        geojson = json.loads(Path(args.geometry_file).read_text(encoding="utf-8"))
+        geojson = read_json_file(Path(args.geometry_file))
         if geojson.get("type") == "FeatureCollection":
             features = geojson.get("features", [])
             if not features:
@@ -174,9 +235,10 @@ def load_geometry_filter(args: argparse.Namespace) -> Optional[str]:
 
 
 def ensure_paths_under_root(paths: Sequence[Path], root: Path) -> None:
+    # Expects already-resolved paths (see compute_mount_root)
     for path in paths:
         try:
-            path.resolve().relative_to(root)
+            path.relative_to(root)
         except ValueError:
             raise SystemExit(
                 f"Path {path} is not under the mount root {root}. "
@@ -187,16 +249,17 @@ def ensure_paths_under_root(paths: Sequence[Path], root: Path) -> None:
 def compute_mount_root(
     paths: Sequence[Path], override_root: Optional[str]
 ) -> Path:
+    resolved = [p.resolve() for p in paths]
     if override_root:
         root = Path(override_root).resolve()
     else:
         try:
-            root = Path(os.path.commonpath([p.resolve() for p in paths]))
+            root = Path(os.path.commonpath(resolved))
         except ValueError:
             raise SystemExit(
                 "Assets and output live on different drives. Please provide --mount-root explicitly."
             )
-    ensure_paths_under_root(paths, root)
+    ensure_paths_under_root(resolved, root)
     return root
 
 
@@ -209,90 +272,244 @@ def to_container_path(path: Path, mount_root: Path) -> str:
     return f"/mnt/data/{rel.as_posix()}"
 
 
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def geometry_column_expr(geometry_column: str, geom_format: str) -> str:
+    """SQL expression decoding the GeoParquet geometry column."""
+    column = quote_identifier(geometry_column)
+    if geom_format == "wkt":
+        return f"ST_GeomFromText({column})"
+    return f"ST_GeomFromWKB({column})"
+
+
+def geometry_filter_function(geometry_filter: str) -> str:
+    """DuckDB spatial constructor for the filter geometry (GeoJSON or WKT)."""
+    if geometry_filter.strip().startswith("{"):
+        return "ST_GeomFromGeoJSON"
+    return "ST_GeomFromText"
+
+
+def read_parquet_sql(parquet_glob: str) -> str:
+    """read_parquet over a glob; DuckDB expands it instead of receiving every path.
+
+    Hive partitioning stays off: the partition files already carry an `hour` column
+    that would collide with the `hour=` key, and the subset keeps the source schema.
+    """
+    return f"read_parquet('{escape_single_quotes(parquet_glob)}', hive_partitioning = false)"
+
+
+def supports_compression_level(version: str) -> bool:
+    """COMPRESSION_LEVEL is accepted by the parquet writer from DuckDB 0.10.3 on."""
+    parts = [int(p) for p in re.findall(r"\d+", version)[:3]]
+    return tuple(parts + [0] * (3 - len(parts))) >= (0, 10, 3)
+
+
+def copy_to_parquet_sql(select_sql: str, output_path: str, compression_level: bool = True) -> str:
+    # ZSTD level 1 favours write speed over a few percent of size for the packaged subset
+    level = f", COMPRESSION_LEVEL {PARQUET_ZSTD_LEVEL}" if compression_level else ""
+    return (
+        f"COPY ({select_sql}) TO '{escape_single_quotes(output_path)}' "
+        f"(FORMAT 'parquet', COMPRESSION 'ZSTD'{level}, ROW_GROUP_SIZE {PARQUET_ROW_GROUP_SIZE})"
+    )
+
+
+def select_subset_sql(parquet_glob: str, where_sql: str, node_table: Optional[str] = None) -> str:
+    """SELECT over the partitions, semi-joined against `node_table` when given."""
+    source = f"{read_parquet_sql(parquet_glob)} AS p"
+    if node_table:
+        source += f" SEMI JOIN {node_table} AS f ON p.node_id = f.node_id"
+    return f"SELECT p.* FROM {source} WHERE {where_sql}"
+
+
 def build_duckdb_sql(
-    asset_paths: Sequence[str],
+    parquet_glob: str,
     output_path: str,
     node_ids: Sequence[str],
     geometry_filter: Optional[str],
     geom_format: str,
     geometry_column: str,
+    memory_limit: Optional[str] = None,
 ) -> str:
-    files_expr = ", ".join(f"'{escape_single_quotes(p)}'" for p in asset_paths)
+    """Self-contained SQL script (literals inlined) for the DuckDB CLI and Docker image."""
     where_clauses: List[str] = []
-    if node_ids:
-        node_expr = ", ".join(f"'{escape_single_quotes(nid)}'" for nid in node_ids)
+    node_table: Optional[str] = None
+    node_expr = ", ".join(f"'{escape_single_quotes(nid)}'" for nid in node_ids)
+    if len(node_ids) > NODE_ID_SEMI_JOIN_THRESHOLD:
+        node_table = NODE_FILTER_TABLE
+    elif node_ids:
         where_clauses.append(f"node_id IN ({node_expr})")
     if geometry_filter:
-        if geometry_filter.strip().startswith("{"):
-            geom_expr = f"ST_GeomFromGeoJSON('{escape_single_quotes(geometry_filter)}')"
-        else:
-            geom_expr = f"ST_GeomFromText('{escape_single_quotes(geometry_filter)}')"
-        if geom_format == "wkt":
-            geom_column_expr = f"ST_GeomFromText({geometry_column})"
-        else:
-            geom_column_expr = f"ST_GeomFromWKB({geometry_column})"
-        where_clauses.append(f"ST_Intersects({geom_column_expr}, {geom_expr})")
+        geom_expr = f"{geometry_filter_function(geometry_filter)}('{escape_single_quotes(geometry_filter)}')"
+        where_clauses.append(
+            f"ST_Intersects({geometry_column_expr(geometry_column, geom_format)}, {geom_expr})"
+        )
     where_sql = " AND ".join(where_clauses) if where_clauses else "TRUE"
-    statements = [
+    statements = [] if not memory_limit else [f"SET memory_limit = '{escape_single_quotes(memory_limit)}'"]
+    statements += [
         "INSTALL spatial",
         "LOAD spatial",
-        f"COPY (SELECT * FROM read_parquet([{files_expr}]) WHERE {where_sql}) "
-        f"TO '{escape_single_quotes(output_path)}' "
-        "(FORMAT 'parquet', COMPRESSION 'ZSTD')",
+        # Row groups are flushed as soon as they fill instead of waiting to keep scan order
+        "SET preserve_insertion_order = false",
     ]
+    if node_table:
+        statements.append(
+            f"CREATE TEMP TABLE {node_table} AS SELECT unnest([{node_expr}]::VARCHAR[]) AS node_id"
+        )
+    statements.append(
+        copy_to_parquet_sql(select_subset_sql(parquet_glob, where_sql, node_table), output_path)
+    )
     return "; ".join(statements) + ";"
 
 
-def run_duckdb_container(
-    sql_docker: str,
-    sql_local: str,
-    mount_root: Path,
-    image: str,
-) -> None:
-    def run_duckdb_local() -> None:
-        # Try Python duckdb module first
+def load_spatial_extension(con: Any) -> None:
+    """Install/load spatial only when needed; INSTALL hits the extension repository."""
+    state = con.execute(
+        "SELECT installed, loaded FROM duckdb_extensions() WHERE extension_name = 'spatial'"
+    ).fetchone()
+    installed, loaded = (bool(state[0]), bool(state[1])) if state else (False, False)
+    if loaded:
+        return
+    if not installed:
+        con.execute("INSTALL spatial")
+    con.execute("LOAD spatial")
+
+
+def run_duckdb_module(
+    duckdb: Any,
+    parquet_glob: str,
+    output_path: str,
+    node_ids: Sequence[str],
+    geometry_filter: Optional[str],
+    geom_format: str,
+    geometry_column: str,
+    memory_limit: Optional[str] = None,
+) -> Optional[int]:
+    """Run the subset in-process, binding node ids and the filter geometry as parameters.
+
+    Filter values are loaded into temp tables through prepared statements, so they
+    are never spliced into SQL text and the node filter becomes a semi-join. Returns
+    the number of rows written, as reported by COPY.
+    """
+    # In-memory database: nothing is persisted besides the COPY output
+    con = duckdb.connect()
+    try:
         try:
-            import duckdb  # type: ignore
-            try:
-                con = duckdb.connect(database=str(mount_root / "tmp.duckdb"))
-                try:
-                    con.execute("PRAGMA disable_progress_bar")
-                except Exception:
-                    pass
-                for stmt in [s.strip() for s in sql_local.split(";") if s.strip()]:
-                    con.execute(stmt)
-                con.close()
-                return
-            except Exception as exc:
-                raise SystemExit(f"DuckDB execution failed locally via Python: {exc}")
-        except ImportError:
+            con.execute("PRAGMA disable_progress_bar")
+        except Exception:
             pass
-
-        # Fallback to duckdb CLI if available
-        if shutil.which("duckdb") is not None:
-            cli_cmd = [
-                "duckdb",
-                "-c",
-                sql_local,
-            ]
-            result = subprocess.run(
-                cli_cmd, check=False, capture_output=True, text=True, cwd=mount_root
+        con.execute(f"PRAGMA threads={os.cpu_count() or 1}")
+        if memory_limit:
+            con.execute(f"SET memory_limit = '{escape_single_quotes(memory_limit)}'")
+        con.execute("SET preserve_insertion_order = false")
+        load_spatial_extension(con)
+        where_clauses: List[str] = []
+        node_table: Optional[str] = None
+        if node_ids:
+            con.execute(
+                f"CREATE TEMP TABLE {NODE_FILTER_TABLE} AS SELECT unnest(?::VARCHAR[]) AS node_id",
+                [list(node_ids)],
             )
-            if result.returncode != 0:
-                sys.stderr.write(result.stderr)
-                raise SystemExit(
-                    f"DuckDB CLI failed with exit code {result.returncode}."
-                )
-            return
+            node_table = NODE_FILTER_TABLE
+        if geometry_filter:
+            # Parse the bound filter once and inline it back as hex WKB (only [0-9A-F]), so
+            # the predicate sees a constant geometry that spatial can prepare for all rows
+            # instead of a per-row scalar subquery.
+            con.execute(
+                f"CREATE TEMP TABLE geometry_filter AS "
+                f"SELECT {geometry_filter_function(geometry_filter)}(?) AS geom",
+                [geometry_filter],
+            )
+            filter_hex = con.execute("SELECT ST_AsHEXWKB(geom) FROM geometry_filter").fetchone()[0]
+            where_clauses.append(
+                f"ST_Intersects({geometry_column_expr(geometry_column, geom_format)}, "
+                f"ST_GeomFromHEXWKB('{escape_single_quotes(str(filter_hex))}'))"
+            )
+        where_sql = " AND ".join(where_clauses) if where_clauses else "TRUE"
+        copied = con.execute(
+            copy_to_parquet_sql(
+                select_subset_sql(parquet_glob, where_sql, node_table),
+                output_path,
+                compression_level=supports_compression_level(getattr(duckdb, "__version__", "")),
+            )
+        ).fetchone()
+        return int(copied[0]) if copied else None
+    finally:
+        con.close()
 
-        raise SystemExit(
-            "DuckDB execution failed: neither docker, duckdb module, nor duckdb CLI available."
+
+def run_duckdb_local(
+    parquet_glob: str,
+    output_path: str,
+    node_ids: Sequence[str],
+    geometry_filter: Optional[str],
+    geom_format: str,
+    geometry_column: str,
+    workdir: Path,
+    memory_limit: Optional[str] = None,
+) -> Optional[int]:
+    """Execute the subset in-process with the duckdb module, else via the duckdb CLI.
+
+    Returns the written row count when DuckDB ran in-process, None otherwise.
+    """
+    try:
+        import duckdb  # type: ignore
+    except ImportError:
+        duckdb = None
+
+    if duckdb is not None:
+        try:
+            return run_duckdb_module(
+                duckdb,
+                parquet_glob,
+                output_path,
+                node_ids=node_ids,
+                geometry_filter=geometry_filter,
+                geom_format=geom_format,
+                geometry_column=geometry_column,
+                memory_limit=memory_limit,
+            )
+        except Exception as exc:
+            raise SystemExit(f"DuckDB execution failed locally via Python: {exc}")
+
+    # Fallback to duckdb CLI if available
+    if shutil.which("duckdb") is not None:
+        sql = build_duckdb_sql(
+            parquet_glob,
+            output_path,
+            node_ids=node_ids,
+            geometry_filter=geometry_filter,
+            geom_format=geom_format,
+            geometry_column=geometry_column,
+            memory_limit=memory_limit,
+        )
+        cli_cmd = [
+            "duckdb",
+            "-c",
+            sql,
+        ]
+        result = subprocess.run(
+            cli_cmd, check=False, capture_output=True, text=True, cwd=workdir
         )
+        if result.returncode != 0:
+            sys.stderr.write(result.stderr)
+            raise SystemExit(
+                f"DuckDB CLI failed with exit code {result.returncode}."
+            )
+        return None
+
+    raise SystemExit(
+        "DuckDB execution failed: neither the duckdb module nor the duckdb CLI is available "
+        "(use --use-docker to run it in a container)."
+    )
+
 
-    # Try docker first if present; fallback to local duckdb on failure or absence.
+def run_duckdb_container(sql_docker: str, mount_root: Path, image: str) -> bool:
+    """Execute the statements in the DuckDB Docker image; returns False when that fails."""
     if shutil.which("docker") is None:
-        run_duckdb_local()
-        return
+        sys.stderr.write("docker is not available.\n")
+        return False
 
     command = [
         "docker",
@@ -311,58 +528,8 @@ def run_duckdb_container(
     )
     if result.returncode != 0:
         sys.stderr.write(result.stderr)
-        sys.stderr.write(
-            "\nDocker execution failed; falling back to local duckdb if available...\n"
-        )
-        run_duckdb_local()
-
-
-def snapshot_source_items(
-    items: Sequence[Item], asset_key: str
-) -> List[Dict[str, Any]]:
-    snapshot: List[Dict[str, Any]] = []
-    for item in items:
-        asset = item.assets.get(asset_key)
-        snapshot.append(
-            {
-                "id": item.id,
-                "href": item.get_self_href(),
-            }
-        )
-    return snapshot
-
-
-def load_item_dict(item: Item, source_root: Path) -> Dict[str, Any]:
-    href = item.get_self_href()
-    if href and "://" not in href and Path(href).exists():
-        try:
-            return json.loads(Path(href).read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    candidate = source_root / "items" / "parquet" / item.id / f"{item.id}.json"
-    if candidate.exists():
-        try:
-            return json.loads(candidate.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return item.to_dict()
-
-
-def union_bbox(items: Sequence[Item]) -> Optional[List[float]]:
-    mins = [float("inf"), float("inf")]
-    maxs = [float("-inf"), float("-inf")]
-    found = False
-    for item in items:
-        if not item.bbox:
-            continue
-        found = True
-        mins[0] = min(mins[0], item.bbox[0])
-        mins[1] = min(mins[1], item.bbox[1])
-        maxs[0] = max(maxs[0], item.bbox[2])
-        maxs[1] = max(maxs[1], item.bbox[3])
-    if not found:
-        return None
-    return [mins[0], mins[1], maxs[0], maxs[1]]
+        return False
+    return True
 
 
 def bbox_to_polygon(bbox: Optional[List[float]]) -> Optional[Dict[str, Any]]:
@@ -383,38 +550,6 @@ def bbox_to_polygon(bbox: Optional[List[float]]) -> Optional[Dict[str, Any]]:
     }
 
 
-def parse_item_datetimes(items: Sequence[Item]) -> Dict[str, Optional[datetime]]:
-    def to_datetime(value: Any) -> Optional[datetime]:
-        if not value:
-            return None
-        if isinstance(value, datetime):
-            return value
-        text = str(value)
-        if text.endswith("Z"):
-            text = text[:-1] + "+00:00"
-        try:
-            return datetime.fromisoformat(text)
-        except ValueError:
-            return None
-
-    starts: List[datetime] = []
-    ends: List[datetime] = []
-    for item in items:
-        props = item.properties
-        start = to_datetime(
-            props.get("start_datetime") or props.get("datetime") or item.datetime
-        )
-        end = to_datetime(props.get("end_datetime") or item.datetime)
-        if start:
-            starts.append(start)
-        if end:
-            ends.append(end)
-    return {
-        "start": min(starts) if starts else None,
-        "end": max(ends) if ends else None,
-    }
-
-
 def safe_isoformat(dt: Optional[datetime]) -> Optional[str]:
     if dt is None:
         return None
@@ -426,6 +561,26 @@ def copy_extent(source_extent: Extent) -> Extent:
     return Extent.from_dict(source_extent.to_dict())
 
 
+def iter_files(root: Path, match: Callable[[str], bool]) -> Iterator[str]:
+    """Yield paths of files under root whose name satisfies match, walking with os.scandir."""
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs: List[str] = []
+                matches: List[str] = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif match(entry.name):
+                        matches.append(entry.path)
+        except FileNotFoundError:
+            continue
+        stack.extend(subdirs)
+        yield from matches
+
+
 def log(msg: str) -> None:
     now = datetime.utcnow().isoformat()
     print(f"[subset] {now} - {msg}", flush=True)
@@ -435,41 +590,66 @@ def read_row_count(path: Path) -> Optional[int]:
     if pq is None:
         return None
     try:
-        return pq.ParquetFile(path).metadata.num_rows
+        return pq.read_metadata(str(path)).num_rows
     except Exception:
         return None
 
 
+def partition_time_range(
+    paths: Iterable[str],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    # Compare the integer partition keys and build datetimes only for the ends;
+    # keys that are not a valid calendar hour are skipped as before.
+    keys = set()
+    for p in paths:
+        match = PARTITION_TIME_RE.search(p)
+        if match is not None:
+            keys.add(tuple(int(value) for value in match.groups()))
+
+    def first_valid(ordered: Iterable[Tuple[int, ...]]) -> Optional[datetime]:
+        for key in ordered:
+            try:
+                return datetime(*key)
+            except ValueError:
+                continue
+        return None
+
+    ordered = sorted(keys)
+    return first_valid(ordered), first_valid(reversed(ordered))
+
+
 def register_parent_catalog(
     parent_catalog: Path, new_collection_href: Path, title: str
 ) -> None:
-    data = json.loads(parent_catalog.read_text(encoding="utf-8"))
+    data = read_json_file(parent_catalog)
     links: List[Dict[str, Any]] = data.get("links", [])
     rel_href = os.path.relpath(
         new_collection_href, start=parent_catalog.parent
     ).replace(os.sep, "/")
-    if any(link.get("href") == f"./{rel_href}" or link.get("href") == rel_href for link in links):
+    child_href = f"./{rel_href}"
+    existing = {link.get("href") for link in links}
+    if child_href in existing or rel_href in existing:
+        # Already registered: leave the parent catalog untouched
         return
     links.append(
         {
             "rel": "child",
-            "href": f"./{rel_href}",
+            "href": child_href,
             "type": "application/json",
             "title": title,
         }
     )
     data["links"] = links
-    parent_catalog.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    write_json_file(parent_catalog, data)
 
 
 def main() -> None:
     args = parse_args()
     source_path = Path(args.source_catalog).resolve()
     log(f"Starting subset. Source collection: {source_path}")
+    # Source items are traced from the item files on disk (see source_items below);
+    # walking the catalog with pystac would parse every item JSON for nothing.
     collection = load_collection(source_path)
-    all_items: List[Any] = []
-    if not args.skip_source_items:
-        all_items = list(collection.get_all_items())
 
     node_ids = read_node_ids(args)
     geometry_filter = load_geometry_filter(args)
@@ -478,22 +658,27 @@ def main() -> None:
 
     collection_base = source_path.parent
     asset_root = collection_base / "assets" / "parquet"
-    asset_paths: List[Path] = sorted(asset_root.glob("**/data.parquet"))
+    asset_paths: List[str] = list(iter_files(asset_root, lambda name: name == "data.parquet"))
     log(f"Found {len(asset_paths)} parquet partitions under {asset_root}")
     if not asset_paths:
         raise SystemExit(f"No Parquet assets found under {asset_root}")
 
     items_root = collection_base / "items" / "parquet"
-    item_files = sorted(items_root.glob("**/*.json"))
+    item_files = list(
+        iter_files(items_root, lambda name: name.endswith(".json") and name != "catalog.json")
+    )
     if not item_files:
         raise SystemExit("Could not locate any source item JSON to clone.")
-    template_json_path = item_files[0]
+    # Item IDs start with the partition timestamp, so the smallest path is the earliest item
+    template_json_path = Path(min(item_files))
     log(f"Using template item: {template_json_path}")
-    template_dict = json.loads(template_json_path.read_text(encoding="utf-8"))
+    template_dict = read_json_file(template_json_path)
     source_item_href = str(template_json_path.resolve())
     source_items = []
     if not args.skip_source_items:
-        source_items = [{"id": p.stem, "href": str(p.resolve())} for p in item_files]
+        source_items = [
+            {"id": os.path.splitext(os.path.basename(p))[0], "href": p} for p in sorted(item_files)
+        ]
     output_dir = Path(args.output_dir).resolve()
     assets_dir = output_dir / "assets"
     assets_dir.mkdir(parents=True, exist_ok=True)
@@ -503,51 +688,62 @@ def main() -> None:
             f"Output file {output_file} already exists. Use --force to overwrite."
         )
 
-    mount_root = compute_mount_root(asset_paths + [output_file], args.mount_root)
-    container_assets = [to_container_path(p, mount_root) for p in asset_paths]
-    container_output = to_container_path(output_file, mount_root)
-    log("Building DuckDB SQL")
-    sql_docker = build_duckdb_sql(
-        container_assets,
-        container_output,
-        node_ids=node_ids,
-        geometry_filter=geometry_filter,
-        geom_format=args.geometry_format,
-        geometry_column=args.geometry_column,
-    )
-    sql_local = build_duckdb_sql(
-        [str(p) for p in asset_paths],
-        str(output_file),
+    filter_kwargs = dict(
         node_ids=node_ids,
         geometry_filter=geometry_filter,
         geom_format=args.geometry_format,
         geometry_column=args.geometry_column,
     )
-    log("Executing DuckDB (container or local fallback)")
-    run_duckdb_container(
-        sql_docker, sql_local, mount_root=mount_root, image=args.duckdb_image
-    )
-    if not output_file.exists():
+    local_glob = f"{asset_root.as_posix()}/{PARQUET_ASSET_GLOB}"
+    # DuckDB writes next to the destination and the file is renamed into place once
+    # complete, so readers of a previous subset never see a partial file.
+    tmp_output = atomic_tmp_path(output_file)
+    tmp_output.unlink(missing_ok=True)
+    copied_rows: Optional[int] = None
+    if args.use_docker:
+        # Container paths are only needed when DuckDB runs behind a bind mount
+        mount_root = compute_mount_root([asset_root, tmp_output], args.mount_root)
+        log("Building DuckDB SQL")
+        sql_docker = build_duckdb_sql(
+            f"{to_container_path(asset_root, mount_root)}/{PARQUET_ASSET_GLOB}",
+            to_container_path(tmp_output, mount_root),
+            memory_limit=args.duckdb_memory_limit,
+            **filter_kwargs,
+        )
+        log("Executing DuckDB in Docker")
+        if not run_duckdb_container(sql_docker, mount_root=mount_root, image=args.duckdb_image):
+            sys.stderr.write(
+                "\nDocker execution failed; falling back to local duckdb if available...\n"
+            )
+            copied_rows = run_duckdb_local(
+                local_glob,
+                str(tmp_output),
+                workdir=output_dir,
+                memory_limit=args.duckdb_memory_limit,
+                **filter_kwargs,
+            )
+    else:
+        log("Executing DuckDB in-process")
+        copied_rows = run_duckdb_local(
+            local_glob,
+            str(tmp_output),
+            workdir=output_dir,
+            memory_limit=args.duckdb_memory_limit,
+            **filter_kwargs,
+        )
+    if not tmp_output.exists():
         raise SystemExit("DuckDB reported success but the output file was not created.")
+    os.replace(tmp_output, output_file)
     log(f"DuckDB finished. Output written to {output_file}")
 
     bbox = template_dict.get("bbox")
     geom = template_dict.get("geometry") or bbox_to_polygon(bbox)
     # Compute temporal range from parquet paths
-    times = []
-    for p in asset_paths:
-        parts = p.parts
-        try:
-            year = next(x for x in parts if x.startswith("year=")).split("=")[1]
-            month = next(x for x in parts if x.startswith("month=")).split("=")[1]
-            day = next(x for x in parts if x.startswith("day=")).split("=")[1]
-            hour = next(x for x in parts if x.startswith("hour=")).split("=")[1]
-            times.append(datetime.fromisoformat(f"{year}-{month}-{day}T{hour}:00:00"))
-        except Exception:
-            continue
-    dt_range = {"start": min(times) if times else None, "end": max(times) if times else None}
+    start, end = partition_time_range(asset_paths)
+    dt_range = {"start": start, "end": end}
     item_datetime = dt_range["start"] or dt_range["end"]
-    row_count = read_row_count(output_file)
+    # COPY reports the rows it wrote; only the CLI/Docker paths need the footer
+    row_count = copied_rows if copied_rows is not None else read_row_count(output_file)
 
     derived_collection_id = args.collection_id or f"{collection.id}-subset"
     derived_title = args.collection_title or f"{collection.title or collection.id} subset"
@@ -566,9 +762,8 @@ def main() -> None:
         summaries=collection.summaries,
     )
     derived_collection.stac_extensions = list(collection.stac_extensions)
-    derived_collection.extra_fields = json.loads(
-        json.dumps(collection.extra_fields, default=str)
-    )
+    # Extra fields were parsed from collection.json, so they only hold JSON types
+    derived_collection.extra_fields = copy.deepcopy(collection.extra_fields)
     source_href = collection.get_self_href() or str(source_path)
     derived_collection.add_link(
         Link(rel="derived_from", target=source_href, media_type="application/json")
@@ -577,7 +772,7 @@ def main() -> None:
     item_id = args.item_id or "subset"
 
     # Clone source item dict to preserve all metadata (sci:doi, providers, links)
-    new_item = json.loads(json.dumps(template_dict))
+    new_item = copy.deepcopy(template_dict)
     new_item["id"] = item_id
 
     orig_desc = (
@@ -656,7 +851,7 @@ def main() -> None:
     for old_item in items_dir.glob("*.json"):
         old_item.unlink()
     item_href = items_dir / f"{item_id}.json"
-    item_href.write_text(json.dumps(new_item, indent=2), encoding="utf-8")
+    write_json_file(item_href, new_item)
     log(f"Saved subset item to {item_href}")
 
     # Build collection JSON manually to avoid item rewriting
@@ -694,7 +889,7 @@ def main() -> None:
         }
     )
     collection_data["links"] = collection_links
-    collection_path.write_text(json.dumps(collection_data, indent=2), encoding="utf-8")
+    write_json_file(collection_path, collection_data)
     log(f"Saved collection to {collection_path}")
 
     parent_catalog_path: Optional[Path] = None
@@ -193,7 +193,8 @@ RUN pip install --no-cache-dir \
     "pyarrow>=14.0.2" \
     "pystac>=1.8.5" \
     "shapely>=2.0.0" \
-    "duckdb>=0.10.2"
+    "duckdb>=0.10.3" \
+    "orjson>=3.9.0"
 WORKDIR /workspace
 EOF
   fi
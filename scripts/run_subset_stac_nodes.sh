@@ -18,12 +18,10 @@ IMAGE_NAME=${STAC_IMAGE_NAME:-wind-interpolation-stac-dkr:latest}
 ensure_image() {
   local image="$1"
   local needs_build=0
+  # DuckDB runs in-process from the image's duckdb module; docker inside the image is
+  # only used when --use-docker is passed.
   if ! docker image inspect "${image}" >/dev/null 2>&1; then
     needs_build=1
-  else
-    if ! docker run --rm "${image}" sh -c "command -v docker >/dev/null 2>&1"; then
-      needs_build=1
-    fi
   fi
   if [ "$needs_build" -eq 1 ]; then
     docker build -t "${image}" - <<'EOF'
@@ -35,7 +33,8 @@ RUN pip install --no-cache-dir \
     "pyarrow>=14.0.2" \
     "pystac>=1.8.5" \
     "shapely>=2.0.0" \
-    "duckdb>=0.10.2"
+    "duckdb>=0.10.3" \
+    "orjson>=3.9.0"
 WORKDIR /workspace
 EOF
   fi
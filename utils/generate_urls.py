@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 # generate_urls.py - Genera URLs de archivos NetCDF de MeteoGalicia para un rango de fechas.
 
+import calendar
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 import csv
+from concurrent.futures import ThreadPoolExecutor
+
+try:  # optional: faster JSON serialisation when available
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # optional: stream only the first feature out of large boundary files
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
 MODEL_CONFIGS = {
     "wrf4km": {
@@ -29,43 +41,56 @@ MODEL_CONFIGS = {
 }
 
 DEFAULT_MODEL = "wrf4km"
+MODEL_FLAGS = frozenset(("-m", "--model"))
+STREAM_FLAGS = {"--ndjson": "ndjson", "--url-lines": "lines"}
 
 
 def _print_usage():
     print(
-        "Usage: generate_urls.py [-m wrf4km|wrf1_3km|wrf1km] "
+        "Usage: generate_urls.py [-m wrf4km|wrf1_3km|wrf1km] [--ndjson|--url-lines] "
         "<YYYY-MM-DD_start> <YYYY-MM-DD_end> "
         "[<boundary1.geojson> [<region_name1>]]... "
-        "[<test_points.csv>]",
+        "[<test_points.csv>]\n"
+        "  --ndjson     stream JSON records, one per line: a leading {\"meta\": {...}}\n"
+        "               with source_model, regions and test_points, then {\"url\": ...}\n"
+        "  --url-lines  stream plain URLs, one per line (no metadata)",
         file=sys.stderr,
     )
 
 
-def _extract_model_option(argv):
-    """Return (model_choice, remaining_args) after consuming -m/--model flags."""
+def _extract_options(argv):
+    """Return (model_choice, stream_format, remaining_args) after consuming option flags.
+
+    stream_format is None for the single JSON object, else "ndjson" or "lines".
+    """
     model = DEFAULT_MODEL
+    stream_format = None
     remaining = []
     i = 0
     while i < len(argv):
         arg = argv[i]
-        if arg in ("-m", "--model"):
+        if arg in MODEL_FLAGS:
             if i + 1 >= len(argv):
                 print("Error: option -m/--model requires an argument.", file=sys.stderr)
                 _print_usage()
                 sys.exit(1)
-            model = argv[i + 1].lower()
+            model = argv[i + 1]
             i += 2
         elif arg.startswith("--model="):
-            model = arg.split("=", 1)[1].lower()
+            model = arg.partition("=")[2]
+            i += 1
+        elif arg in STREAM_FLAGS:
+            stream_format = STREAM_FLAGS[arg]
             i += 1
         else:
             remaining.append(arg)
             i += 1
-    return model, remaining
+    # Normalise only the value that wins when -m is repeated
+    return model.lower(), stream_format, remaining
 
 
 args = sys.argv[1:]
-model_choice, positional_args = _extract_model_option(args)
+model_choice, stream_format, positional_args = _extract_options(args)
 if model_choice not in MODEL_CONFIGS:
     allowed = ", ".join(sorted(MODEL_CONFIGS.keys()))
     print(f"Error: unknown model '{model_choice}'. Allowed values: {allowed}", file=sys.stderr)
@@ -77,8 +102,10 @@ if len(positional_args) < 2:
     sys.exit(1)
 
 try:
-    start_date = datetime.strptime(positional_args[0], "%Y-%m-%d")
-    end_date = datetime.strptime(positional_args[1], "%Y-%m-%d")
+    # strptime, not date.fromisoformat: keeps accepting unpadded 2024-1-5 and
+    # rejecting basic/week forms (20240105, 2024-W01-1) that 3.11 would allow
+    start_date = datetime.strptime(positional_args[0], "%Y-%m-%d").date()
+    end_date = datetime.strptime(positional_args[1], "%Y-%m-%d").date()
 except ValueError as e:
     print(f"Error en formato de fecha: {e}", file=sys.stderr)
     sys.exit(1)
@@ -87,64 +114,84 @@ if end_date < start_date:
     print("Error: la fecha final es anterior a la inicial", file=sys.stderr)
     sys.exit(1)
 
-def _build_url(model_key, date_obj):
+def _url_builder(model_key):
+    """Return a (year, month, YYYYMMDD) -> URL function specialised for one model."""
     cfg = MODEL_CONFIGS[model_key]
-    date_str = date_obj.strftime("%Y%m%d")
-    filename = cfg["filename_template"].format(date=date_str)
+    base_url = cfg["base_url"]
+    prefix, suffix = cfg["filename_template"].split("{date}")
     if cfg["folder_style"] == "year_month":
-        year = date_obj.strftime("%Y")
-        month = date_obj.strftime("%m")
-        return f"{cfg['base_url']}/{year}/{month}/{filename}"
+        return lambda year, month, date_str: (
+            f"{base_url}/{year:04d}/{month:02d}/{prefix}{date_str}{suffix}"
+        )
     if cfg["folder_style"] == "yyyymmdd":
-        folder = date_obj.strftime("%Y%m%d")
-        return f"{cfg['base_url']}/{folder}/{filename}"
+        return lambda year, month, date_str: f"{base_url}/{date_str}/{prefix}{date_str}{suffix}"
     raise ValueError(f"Unsupported folder style {cfg['folder_style']} for model {model_key}")
 
 
-urls = []
-current = start_date
-while current <= end_date:
-    urls.append(_build_url(model_choice, current))
-    current += timedelta(days=1)
+def _iter_days(start, end):
+    """Yield (year, month, YYYYMMDD) for each day in [start, end] using integer arithmetic."""
+    year, month, day = start.year, start.month, start.day
+    end_key = (end.year, end.month, end.day)
+    days_in_month = calendar.monthrange(year, month)[1]
+    while (year, month, day) <= end_key:
+        yield year, month, f"{year:04d}{month:02d}{day:02d}"
+        day += 1
+        if day > days_in_month:
+            day = 1
+            month += 1
+            if month > 12:
+                month = 1
+                year += 1
+            days_in_month = calendar.monthrange(year, month)[1]
 
-# Create JSON output with list of URLs
-output = {"urlList": urls, "source_model": model_choice}
+
+build_url = _url_builder(model_choice)
 
 # Separate optional test points CSV from region arguments
-extra_args = positional_args[2:]
-csv_args = [arg for arg in extra_args if arg.lower().endswith('.csv')]
+csv_args = []
+region_args = []
+for arg in positional_args[2:]:
+    (csv_args if arg[-4:].lower() == '.csv' else region_args).append(arg)
 if len(csv_args) > 1:
     print("Error: only one test_points CSV may be provided", file=sys.stderr)
     sys.exit(1)
 csv_path = csv_args[0] if csv_args else None
-region_args = [arg for arg in extra_args if not arg.lower().endswith('.csv')]
 
-# Parse multiple boundary.geojson + optional region_name pairs
-regions = []
-i = 0
-while i < len(region_args):
-    geojson_path = region_args[i]
-    region_name = None
-    if i + 1 < len(region_args):
-        region_name = region_args[i+1]
-        i += 2
+def _load_first_geometry(geojson_path):
+    """Return the geometry of the first feature (or the bare geometry) in a GeoJSON file."""
+    if ijson is not None:
+        # FeatureCollections are by far the common case: stop after the first feature
+        # instead of materialising every boundary in the file.
+        with open(geojson_path, 'rb') as f:
+            geom = next(ijson.items(f, 'features.item.geometry', use_float=True), None)
+        if geom is not None:
+            return geom
+    if orjson is not None:
+        with open(geojson_path, 'rb') as f:
+            gj = orjson.loads(f.read())
     else:
-        i += 1
-    try:
         with open(geojson_path, 'r') as f:
             gj = json.load(f)
-        # Extract geometry
-        if gj.get('type') == 'FeatureCollection':
-            feats = gj.get('features', [])
-            if not feats:
-                raise ValueError('Empty FeatureCollection')
-            geom = feats[0].get('geometry', {})
-        elif gj.get('type') == 'Feature':
-            geom = gj.get('geometry', {})
-        elif gj.get('type') in ('Polygon', 'MultiPolygon'):
-            geom = gj
-        else:
-            raise ValueError(f"Unsupported GeoJSON type: {gj.get('type')}")
+    if gj.get('type') == 'FeatureCollection':
+        feats = gj.get('features', [])
+        if not feats:
+            raise ValueError('Empty FeatureCollection')
+        return feats[0].get('geometry', {})
+    if gj.get('type') == 'Feature':
+        return gj.get('geometry', {})
+    if gj.get('type') in ('Polygon', 'MultiPolygon'):
+        return gj
+    raise ValueError(f"Unsupported GeoJSON type: {gj.get('type')}")
+
+
+class BoundaryError(Exception):
+    """A boundary file that could not be read, with the message shown to the user."""
+
+
+def _parse_one_boundary(pair):
+    geojson_path, region_name = pair
+    try:
+        geom = _load_first_geometry(geojson_path)
         if geom.get('type') == 'Polygon':
             polygon = geom.get('coordinates', [])[0]
         elif geom.get('type') == 'MultiPolygon':
@@ -152,35 +199,131 @@ while i < len(region_args):
         else:
             raise ValueError(f"Unsupported geometry type: {geom.get('type')}")
     except Exception as e:
-        print(f"Error reading GeoJSON boundary '{geojson_path}': {e}", file=sys.stderr)
-        sys.exit(1)
+        raise BoundaryError(f"Error reading GeoJSON boundary '{geojson_path}': {e}")
     if not region_name:
         region_name = os.path.splitext(os.path.basename(geojson_path))[0]
-    regions.append({"region_name": region_name, "polygon": polygon})
-# Add regions to output if provided
-if regions:
-    output["regions"] = regions
+    return {"region_name": region_name, "polygon": polygon}
+
 
- # Parse single test points CSV if provided
+# Parse multiple boundary.geojson + optional region_name pairs
+boundary_pairs = []
+i = 0
+while i < len(region_args):
+    geojson_path = region_args[i]
+    region_name = None
+    if i + 1 < len(region_args):
+        region_name = region_args[i+1]
+        i += 2
+    else:
+        i += 1
+    boundary_pairs.append((geojson_path, region_name))
+
+# Files are read concurrently; map() keeps argument order and re-raises the first
+# failure in that order, as the sequential loop did.
+regions = []
+if boundary_pairs:
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, len(boundary_pairs))) as pool:
+            regions = list(pool.map(_parse_one_boundary, boundary_pairs))
+    except BoundaryError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+def _read_test_points(csv_path):
+    """Parse name/lon/lat rows, resolving the accepted column aliases once from the header."""
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        # Last occurrence wins for repeated headers, as with csv.DictReader
+        index = {column: i for i, column in enumerate(header)}
+
+        def columns(*aliases):
+            return [index[alias] for alias in aliases if alias in index]
+
+        lon_cols = columns('lon', 'longitude')
+        lat_cols = columns('lat', 'latitude')
+        name_cols = columns('name', 'test_point', 'Name')
+
+        def first(values, cols):
+            for i in cols:
+                if i < len(values) and values[i]:
+                    return values[i]
+            return None
+
+        points = []
+        for values in reader:
+            if not values:
+                continue  # blank line, skipped like csv.DictReader does
+            try:
+                lon = float(first(values, lon_cols))
+                lat = float(first(values, lat_cols))
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid coordinates in {csv_path}: {dict(zip(header, values))}")
+            name = first(values, name_cols)
+            if not name:
+                raise ValueError(
+                    f"Missing name for test point in {csv_path}: {dict(zip(header, values))}"
+                )
+            points.append({'name': name, 'lon': lon, 'lat': lat})
+    return points
+
+
+# Parse single test points CSV if provided
 test_points = []
 if csv_path:
     try:
-        with open(csv_path, newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    lon = float(row.get('lon') or row.get('longitude'))
-                    lat = float(row.get('lat') or row.get('latitude'))
-                except (TypeError, ValueError):
-                    raise ValueError(f"Invalid coordinates in {csv_path}: {row}")
-                name = row.get('name') or row.get('test_point') or row.get('Name')
-                if not name:
-                    raise ValueError(f"Missing name for test point in {csv_path}: {row}")
-                test_points.append({'name': name, 'lon': lon, 'lat': lat})
+        test_points = _read_test_points(csv_path)
     except Exception as e:
         print(f"Error reading test points CSV '{csv_path}': {e}", file=sys.stderr)
         sys.exit(1)
+
+
+def _dumps_compact(obj):
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+if stream_format:
+    # URLs are written as they are generated; consumers such as `head` may close
+    # the pipe early, which ends the run quietly.
+    write = sys.stdout.write
+    try:
+        if stream_format == "ndjson":
+            meta = {"source_model": model_choice}
+            if regions:
+                meta["regions"] = regions
+            if test_points:
+                meta["test_points"] = test_points
+            write(f"{_dumps_compact({'meta': meta})}\n")
+            for year, month, date_str in _iter_days(start_date, end_date):
+                write(f"{_dumps_compact({'url': build_url(year, month, date_str)})}\n")
+        else:
+            for year, month, date_str in _iter_days(start_date, end_date):
+                write(f"{build_url(year, month, date_str)}\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Keep the interpreter's final flush from raising again on the closed pipe
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    sys.exit(0)
+
+# Create JSON output with list of URLs
+output = {
+    "urlList": [
+        build_url(year, month, date_str)
+        for year, month, date_str in _iter_days(start_date, end_date)
+    ],
+    "source_model": model_choice,
+}
+# Add regions and test points to output if provided
+if regions:
+    output["regions"] = regions
 if test_points:
     output['test_points'] = test_points
 
-print(json.dumps(output))
+# Compact JSON straight to stdout; the Step Functions input is size-limited
+if orjson is not None:
+    sys.stdout.buffer.write(orjson.dumps(output) + b"\n")
+else:
+    json.dump(output, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")